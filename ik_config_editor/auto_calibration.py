@@ -1,13 +1,266 @@
 """Automatic calibration for rotation offsets and scale factors."""
 
+import functools
+import math
+import re
+
 import numpy as np
-from scipy.spatial.transform import Rotation as R
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from ik_config_editor.skeleton_loader import Skeleton
+
+# Body-name keywords used to suggest IK weights
+# High position weight for end effectors and pelvis (grounding)
+_HIGH_POS_KEYWORDS = ("foot", "toe", "ankle", "pelvis", "hand")
+# Medium position weight for intermediate joints
+_MED_POS_KEYWORDS = ("knee", "elbow", "wrist", "hip", "shoulder")
+# Very high rotation weight for end effectors
+_VHIGH_ROT_KEYWORDS = ("foot", "toe", "hand", "wrist")
+# Higher rotation weight for spine, shoulders (important orientation)
+_HIGH_ROT_KEYWORDS = ("spine", "torso", "shoulder")
+
+# Joins target and source names so one scan covers both; NUL never occurs in
+# body names, so no keyword can match across the boundary
+_NAME_SEPARATOR = "\x00"
+
+# Body-name keywords marking the lowest points of a skeleton
+_FOOT_KEYWORDS = ("foot", "toe", "ankle")
+_FOOT_RE = re.compile("|".join(_FOOT_KEYWORDS))
+
+# Common kinematic chains measured for per-limb scaling
+# Format: (parent, child) pairs of source body names
+COMMON_CHAINS = (
+    # Legs
+    ("pelvis", "left_hip"),
+    ("left_hip", "left_knee"),
+    ("left_knee", "left_foot"),
+    ("pelvis", "right_hip"),
+    ("right_hip", "right_knee"),
+    ("right_knee", "right_foot"),
+    # Arms
+    ("spine3", "left_shoulder"),
+    ("left_shoulder", "left_elbow"),
+    ("left_elbow", "left_wrist"),
+    ("spine3", "right_shoulder"),
+    ("right_shoulder", "right_elbow"),
+    ("right_elbow", "right_wrist"),
+    # Torso
+    ("pelvis", "spine3"),
+)
+
+
+# Row count from which the numba kernel beats importing and compiling it
+_NUMBA_MIN_ROWS = 10_000
+
+
+def _quat_mul_inv_batch_loop(src, tgt, out):
+    """Write q_src^{-1} * q_tgt for each row of (N, 4) [w, x, y, z] arrays into out."""
+    for i in range(src.shape[0]):
+        # Inverse of a unit quaternion is its conjugate
+        aw = src[i, 0]
+        ax = -src[i, 1]
+        ay = -src[i, 2]
+        az = -src[i, 3]
+        bw = tgt[i, 0]
+        bx = tgt[i, 1]
+        by = tgt[i, 2]
+        bz = tgt[i, 3]
+
+        out[i, 0] = aw*bw - ax*bx - ay*by - az*bz
+        out[i, 1] = aw*bx + ax*bw + ay*bz - az*by
+        out[i, 2] = aw*by - ax*bz + ay*bw + az*bx
+        out[i, 3] = aw*bz + ax*by - ay*bx + az*bw
+
+
+def _quat_mul_inv_batch_numpy(src, tgt, out):
+    """Vectorized NumPy version of _quat_mul_inv_batch_loop."""
+    aw, ax, ay, az = src.T
+    bw, bx, by, bz = tgt.T
+
+    # Inverse of a unit quaternion is its conjugate, so the vector part flips sign
+    out[:, 0] = aw*bw + ax*bx + ay*by + az*bz
+    out[:, 1] = aw*bx - ax*bw - ay*bz + az*by
+    out[:, 2] = aw*by + ax*bz - ay*bw - az*bx
+    out[:, 3] = aw*bz - ax*by + ay*bx - az*bw
+
+
+@functools.lru_cache(maxsize=None)
+def _get_quat_mul_inv_batch_numba():
+    """Return the numba offset kernel, JIT-compiling it on first use.
+
+    numba is imported here instead of at module import since it is slow to
+    import and only needed for very large correspondence sets.
+
+    Returns:
+        The compiled kernel, or None if numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional
+        return None
+    return njit(cache=True, fastmath=True)(_quat_mul_inv_batch_loop)
+
+
+def _quat_mul_inv_batch(src, tgt, out):
+    """Write q_src^{-1} * q_tgt for each row into out, using numba for large N.
+
+    Below _NUMBA_MIN_ROWS the NumPy path finishes long before numba would have
+    been imported and the kernel compiled, which matters for one-shot exports.
+    """
+    if len(src) >= _NUMBA_MIN_ROWS:
+        kernel = _get_quat_mul_inv_batch_numba()
+        if kernel is not None:
+            kernel(src, tgt, out)
+            return
+    _quat_mul_inv_batch_numpy(src, tgt, out)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_chain_indices(
+    correspondences_frozen: frozenset,
+    source_names: Tuple[str, ...],
+    target_names: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """Resolve COMMON_CHAINS to skeleton index pairs.
+
+    Takes hashable snapshots of the inputs so repeated calibrations with
+    unchanged skeletons and correspondences are a cache hit. The returned
+    arrays are shared between calls and marked read-only.
+
+    Returns:
+        Tuple of (child source bodies, source index pairs (M, 2),
+        target index pairs (M, 2))
+    """
+    correspondences = dict(correspondences_frozen)
+    src_idx = {name: i for i, name in enumerate(source_names)}
+    tgt_idx = {name: i for i, name in enumerate(target_names)}
+
+    children = []
+    src_pairs = []
+    tgt_pairs = []
+    for source_parent, source_child in COMMON_CHAINS:
+        # Check if both bodies are in correspondences
+        if source_parent in correspondences and source_child in correspondences:
+            target_parent = correspondences[source_parent]
+            target_child = correspondences[source_child]
+
+            # Skip if bodies don't exist
+            if (source_parent not in src_idx or source_child not in src_idx
+                    or target_parent not in tgt_idx or target_child not in tgt_idx):
+                continue
+
+            children.append(source_child)
+            src_pairs.append((src_idx[source_parent], src_idx[source_child]))
+            tgt_pairs.append((tgt_idx[target_parent], tgt_idx[target_child]))
+
+    src_pairs = np.array(src_pairs, dtype=np.intp).reshape(-1, 2)
+    tgt_pairs = np.array(tgt_pairs, dtype=np.intp).reshape(-1, 2)
+    src_pairs.flags.writeable = False
+    tgt_pairs.flags.writeable = False
+
+    return tuple(children), src_pairs, tgt_pairs
+
+
+@functools.lru_cache(maxsize=4096)
+def _lc(name: str) -> str:
+    """Lowercase a body name, memoized across calibration passes."""
+    return name.lower()
+
+
+def _keyword_mask(names: np.ndarray, keywords: Tuple[str, ...]) -> np.ndarray:
+    """Return a boolean mask that is True where any keyword occurs in the name."""
+    mask = np.zeros(names.shape, dtype=bool)
+    for keyword in keywords:
+        mask |= np.char.find(names, keyword) >= 0
+    return mask
+
+
+class PreparedSkeleton(NamedTuple):
+    """Skeleton packed into contiguous arrays for calibration.
+
+    Built by AutoCalibration.prepare() in a single pass over the skeleton dict.
+    """
+
+    names: List[str]
+    name_to_idx: Dict[str, int]
+    positions: np.ndarray     # (N, 3)
+    orientations: np.ndarray  # (N, 4) quaternions [w, x, y, z]
+    foot_mask: np.ndarray     # (N,) True for foot/toe/ankle bodies
+
+
+SkeletonLike = Union[Dict[str, Dict[str, List[float]]], Skeleton, PreparedSkeleton]
 
 
 class AutoCalibration:
     """Calculate automatic rotation offsets and scale factors for IK configs."""
 
+    @staticmethod
+    def prepare(skeleton: SkeletonLike) -> PreparedSkeleton:
+        """Pack a skeleton into contiguous arrays in a single pass.
+
+        The calibration methods accept a skeleton dict, a Skeleton or the
+        result of this method; preparing once lets several calls share the
+        same arrays. A Skeleton's arrays are shared rather than copied.
+
+        Args:
+            skeleton: Skeleton data (returned unchanged if already prepared)
+
+        Returns:
+            PreparedSkeleton with names, name index, positions, orientations
+            and foot mask
+        """
+        if isinstance(skeleton, PreparedSkeleton):
+            return skeleton
+
+        if isinstance(skeleton, Skeleton):
+            # Already packed: share its arrays and only derive the foot mask
+            foot_search = _FOOT_RE.search
+            foot_mask = np.fromiter(
+                (foot_search(_lc(name)) is not None for name in skeleton.names),
+                dtype=bool, count=len(skeleton.names)
+            )
+            return PreparedSkeleton(
+                skeleton.names, skeleton.name_to_idx,
+                skeleton.positions, skeleton.orientations, foot_mask
+            )
+
+        n = len(skeleton)
+        names = []
+        name_to_idx = {}
+        positions = np.empty((n, 3))
+        orientations = np.empty((n, 4))
+        foot_mask = np.zeros(n, dtype=bool)
+
+        # Bind hot lookups to locals for the per-body loop
+        append_name = names.append
+        foot_search = _FOOT_RE.search
+
+        for i, (body_name, data) in enumerate(skeleton.items()):
+            append_name(body_name)
+            name_to_idx[body_name] = i
+            positions[i] = data["position"]
+            orientations[i] = data["orientation"]
+            foot_mask[i] = foot_search(_lc(body_name)) is not None
+
+        return PreparedSkeleton(names, name_to_idx, positions, orientations, foot_mask)
+
+    @staticmethod
+    def calculate_bone_lengths_vec(
+        positions: np.ndarray,
+        idx_pairs: np.ndarray
+    ) -> np.ndarray:
+        """Calculate many bone lengths at once.
+
+        Args:
+            positions: Body positions as an (N, 3) array
+            idx_pairs: (M, 2) array of body index pairs
+
+        Returns:
+            Array of M Euclidean distances
+        """
+        idx_pairs = np.asarray(idx_pairs, dtype=np.intp).reshape(-1, 2)
+        return np.linalg.norm(positions[idx_pairs[:, 1]] - positions[idx_pairs[:, 0]], axis=1)
+
     @staticmethod
     def calculate_rotation_offset(
         source_orientation: np.ndarray,
@@ -23,6 +276,9 @@ class AutoCalibration:
 
         Therefore: q_offset = q_source^{-1} * q_target
 
+        Both inputs must be unit quaternions (as produced by MuJoCo and SMPL-X);
+        they are not renormalized, and the inverse is taken as the conjugate.
+
         Args:
             source_orientation: Source orientation as quaternion [w, x, y, z]
             target_orientation: Target orientation as quaternion [w, x, y, z]
@@ -30,49 +286,61 @@ class AutoCalibration:
         Returns:
             Rotation offset as quaternion [w, x, y, z]
         """
-        # Convert to scipy Rotation objects (expects x, y, z, w format)
-        source_rot = R.from_quat([
-            source_orientation[1], source_orientation[2],
-            source_orientation[3], source_orientation[0]
-        ])
-        target_rot = R.from_quat([
-            target_orientation[1], target_orientation[2],
-            target_orientation[3], target_orientation[0]
+        # Inverse of a unit quaternion is its conjugate
+        aw = source_orientation[0]
+        ax = -source_orientation[1]
+        ay = -source_orientation[2]
+        az = -source_orientation[3]
+        bw, bx, by, bz = target_orientation
+
+        # Hamilton product: q_offset = q_source^{-1} * q_target
+        return np.array([
+            aw*bw - ax*bx - ay*by - az*bz,
+            aw*bx + ax*bw + ay*bz - az*by,
+            aw*by - ax*bz + ay*bw + az*bx,
+            aw*bz + ax*by - ay*bx + az*bw,
         ])
 
-        # Calculate offset: q_offset = q_source^{-1} * q_target
-        offset_rot = source_rot.inv() * target_rot
-
-        # Convert back to [w, x, y, z] format
-        offset_quat = offset_rot.as_quat()  # Returns [x, y, z, w]
-        return np.array([offset_quat[3], offset_quat[0], offset_quat[1], offset_quat[2]])
-
     @staticmethod
     def calculate_all_rotation_offsets(
-        source_skeleton: Dict[str, Dict[str, List[float]]],
-        target_skeleton: Dict[str, Dict[str, List[float]]],
+        source_skeleton: SkeletonLike,
+        target_skeleton: SkeletonLike,
         correspondences: Dict[str, str]
     ) -> Dict[str, np.ndarray]:
         """Calculate rotation offsets for all correspondences.
 
+        Skeleton orientations must be unit quaternions; they are not renormalized.
+
         Args:
-            source_skeleton: Source skeleton data
-            target_skeleton: Target skeleton data
+            source_skeleton: Source skeleton data (dict or PreparedSkeleton)
+            target_skeleton: Target skeleton data (dict or PreparedSkeleton)
             correspondences: Mapping from source body to target body
 
         Returns:
-            Dictionary mapping target body name to rotation offset quaternion
+            Dictionary mapping target body name to rotation offset quaternion.
+            The quaternions are row views into a single (N, 4) array; copy one
+            before modifying it in place.
         """
-        rotation_offsets = {}
+        if not correspondences:
+            return {}
 
-        for source_body, target_body in correspondences.items():
-            source_ori = np.array(source_skeleton[source_body]["orientation"])
-            target_ori = np.array(target_skeleton[target_body]["orientation"])
+        source = AutoCalibration.prepare(source_skeleton)
+        target = AutoCalibration.prepare(target_skeleton)
 
-            offset = AutoCalibration.calculate_rotation_offset(source_ori, target_ori)
-            rotation_offsets[target_body] = offset
+        # Gather all orientations into (N, 4) arrays and compute every offset at once
+        source_idx = source.name_to_idx
+        target_idx = target.name_to_idx
+        source_quats = source.orientations[[source_idx[body] for body in correspondences]]
+        target_quats = target.orientations[[target_idx[body] for body in correspondences.values()]]
 
-        return rotation_offsets
+        # Hamilton product: q_offset = q_source^{-1} * q_target, written into one buffer
+        offsets = np.empty((len(correspondences), 4))
+        _quat_mul_inv_batch(source_quats, target_quats, offsets)
+
+        return {
+            target_body: offsets[i]
+            for i, target_body in enumerate(correspondences.values())
+        }
 
     @staticmethod
     def calculate_bone_length(
@@ -90,9 +358,13 @@ class AutoCalibration:
         Returns:
             Euclidean distance between the two bodies
         """
-        pos1 = np.array(skeleton[body1]["position"])
-        pos2 = np.array(skeleton[body2]["position"])
-        return np.linalg.norm(pos2 - pos1)
+        # Plain float math: cheaper than np.linalg.norm for a single 3-vector
+        pos1 = skeleton[body1]["position"]
+        pos2 = skeleton[body2]["position"]
+        dx = pos2[0] - pos1[0]
+        dy = pos2[1] - pos1[1]
+        dz = pos2[2] - pos1[2]
+        return math.sqrt(dx*dx + dy*dy + dz*dz)
 
     @staticmethod
     def calculate_scale_factor(
@@ -132,8 +404,8 @@ class AutoCalibration:
 
     @staticmethod
     def calculate_height_scale(
-        source_skeleton: Dict[str, Dict[str, List[float]]],
-        target_skeleton: Dict[str, Dict[str, List[float]]],
+        source_skeleton: SkeletonLike,
+        target_skeleton: SkeletonLike,
         pelvis_name_source: str = "pelvis",
         pelvis_name_target: str = "pelvis"
     ) -> float:
@@ -143,8 +415,8 @@ class AutoCalibration:
         (ground level) and returns the ratio.
 
         Args:
-            source_skeleton: Source skeleton data
-            target_skeleton: Target skeleton data
+            source_skeleton: Source skeleton data (dict or PreparedSkeleton)
+            target_skeleton: Target skeleton data (dict or PreparedSkeleton)
             pelvis_name_source: Name of pelvis body in source skeleton
             pelvis_name_target: Name of pelvis body in target skeleton
 
@@ -155,26 +427,17 @@ class AutoCalibration:
         """
         def get_height(skeleton, pelvis_name):
             """Get height from pelvis to lowest foot position."""
+            prepared = AutoCalibration.prepare(skeleton)
+
             # Get pelvis Z position
-            if pelvis_name not in skeleton:
+            if pelvis_name not in prepared.name_to_idx:
                 raise ValueError(f"Pelvis body '{pelvis_name}' not found in skeleton")
 
-            pelvis_z = skeleton[pelvis_name]["position"][2]
-
-            # Find all foot/toe/ankle bodies (lowest points)
-            foot_keywords = ["foot", "toe", "ankle"]
-            foot_positions = []
+            pelvis_z = prepared.positions[prepared.name_to_idx[pelvis_name], 2]
 
-            for body_name, data in skeleton.items():
-                body_lower = body_name.lower()
-                if any(keyword in body_lower for keyword in foot_keywords):
-                    foot_positions.append(data["position"][2])
-
-            if not foot_positions:
-                # If no foot bodies found, use ground as Z=0
-                min_foot_z = 0.0
-            else:
-                min_foot_z = min(foot_positions)
+            # Lowest foot/toe/ankle body; if none found, use ground as Z=0
+            foot_z = prepared.positions[prepared.foot_mask, 2]
+            min_foot_z = foot_z.min() if foot_z.size else 0.0
 
             height = pelvis_z - min_foot_z
             return height if height > 0 else 1.0  # Avoid zero/negative heights
@@ -192,17 +455,18 @@ class AutoCalibration:
 
     @staticmethod
     def calculate_limb_scales(
-        source_skeleton: Dict[str, Dict[str, List[float]]],
-        target_skeleton: Dict[str, Dict[str, List[float]]],
+        source_skeleton: SkeletonLike,
+        target_skeleton: SkeletonLike,
         correspondences: Dict[str, str]
     ) -> Dict[str, float]:
         """Calculate scale factors for limbs based on correspondences.
 
-        This attempts to find common kinematic chains and calculate scales.
+        This attempts to find common kinematic chains (COMMON_CHAINS) and
+        calculate scales.
 
         Args:
-            source_skeleton: Source skeleton data
-            target_skeleton: Target skeleton data
+            source_skeleton: Source skeleton data (dict or PreparedSkeleton)
+            target_skeleton: Target skeleton data (dict or PreparedSkeleton)
             correspondences: Body correspondences
 
         Returns:
@@ -210,120 +474,138 @@ class AutoCalibration:
         """
         scales = {}
 
-        # Define common kinematic chains to measure
-        # Format: (parent, child) pairs
-        common_chains = [
-            # Legs
-            ("pelvis", "left_hip"),
-            ("left_hip", "left_knee"),
-            ("left_knee", "left_foot"),
-            ("pelvis", "right_hip"),
-            ("right_hip", "right_knee"),
-            ("right_knee", "right_foot"),
-            # Arms
-            ("spine3", "left_shoulder"),
-            ("left_shoulder", "left_elbow"),
-            ("left_elbow", "left_wrist"),
-            ("spine3", "right_shoulder"),
-            ("right_shoulder", "right_elbow"),
-            ("right_elbow", "right_wrist"),
-            # Torso
-            ("pelvis", "spine3"),
-        ]
+        source = AutoCalibration.prepare(source_skeleton)
+        target = AutoCalibration.prepare(target_skeleton)
 
-        for source_parent, source_child in common_chains:
-            # Check if both bodies are in correspondences
-            if source_parent in correspondences and source_child in correspondences:
-                target_parent = correspondences[source_parent]
-                target_child = correspondences[source_child]
+        # Resolve chains whose bodies exist in both skeletons (cached)
+        children, src_pairs, tgt_pairs = _resolve_chain_indices(
+            frozenset(correspondences.items()),
+            tuple(source.names),
+            tuple(target.names),
+        )
 
-                try:
-                    scale = AutoCalibration.calculate_scale_factor(
-                        source_skeleton, target_skeleton,
-                        source_parent, source_child,
-                        target_parent, target_child
-                    )
+        # Measure all bones in one pass per skeleton
+        source_lengths = AutoCalibration.calculate_bone_lengths_vec(source.positions, src_pairs)
+        target_lengths = AutoCalibration.calculate_bone_lengths_vec(target.positions, tgt_pairs)
 
-                    # Assign scale to the child body (the one being scaled from parent)
-                    scales[source_child] = scale
+        # Scale = source_length / target_length, 1.0 where the target bone has zero length
+        limb_scales = np.divide(
+            source_lengths, target_lengths,
+            out=np.ones_like(source_lengths), where=target_lengths != 0
+        )
 
-                except (KeyError, ZeroDivisionError):
-                    # Skip if bodies don't exist or have zero distance
-                    continue
+        # Assign scale to the child body (the one being scaled from parent)
+        scales.update(zip(children, limb_scales.tolist()))
 
         # Fill in missing scales with 1.0
-        for source_body in correspondences.keys():
-            if source_body not in scales:
-                scales[source_body] = 1.0
+        set_default = scales.setdefault
+        for source_body in correspondences:
+            set_default(source_body, 1.0)
 
         return scales
 
     @staticmethod
-    def suggest_position_weights(
+    def _lowercase_correspondences(
         correspondences: Dict[str, str]
+    ) -> List[Tuple[str, str, str, str]]:
+        """Lowercase correspondence names once for keyword matching.
+
+        Args:
+            correspondences: Body correspondences
+
+        Returns:
+            List of (source_body, target_body, source_lower, target_lower)
+        """
+        return [
+            (source_body, target_body, _lc(source_body), _lc(target_body))
+            for source_body, target_body in correspondences.items()
+        ]
+
+    @staticmethod
+    def _combined_names(
+        lowered: List[Tuple[str, str, str, str]]
+    ) -> Tuple[List[str], np.ndarray]:
+        """Join lowercased target and source names for keyword matching.
+
+        Args:
+            lowered: Output of _lowercase_correspondences
+
+        Returns:
+            Tuple of (target body names, array of joined lowercase names)
+        """
+        target_bodies = [target_body for _, target_body, _, _ in lowered]
+        combined = np.array(
+            [
+                target_lower + _NAME_SEPARATOR + source_lower
+                for _, _, source_lower, target_lower in lowered
+            ],
+            dtype=str
+        )
+        return target_bodies, combined
+
+    @staticmethod
+    def suggest_position_weights(
+        correspondences: Dict[str, str],
+        lowered: Optional[List[Tuple[str, str, str, str]]] = None
     ) -> Dict[str, float]:
         """Suggest position weights based on body names.
 
         Args:
             correspondences: Body correspondences
+            lowered: Optional output of _lowercase_correspondences(correspondences),
+                to share the lowercasing with suggest_rotation_weights
 
         Returns:
             Dictionary mapping target body names to suggested position weights
         """
-        weights = {}
-
-        # High weight (100) for end effectors and pelvis (grounding)
-        high_weight_keywords = ['foot', 'toe', 'ankle', 'pelvis', 'hand']
-        # Medium weight (10-50) for intermediate joints
-        medium_weight_keywords = ['knee', 'elbow', 'wrist', 'hip', 'shoulder']
-        # Low weight (0) for most rotation-only joints
-        # Default is 0
-
-        for source_body, target_body in correspondences.items():
-            target_lower = target_body.lower()
-            source_lower = source_body.lower()
-
-            # Check for high weight keywords
-            if any(kw in target_lower or kw in source_lower for kw in high_weight_keywords):
-                weights[target_body] = 100.0
-            # Check for medium weight keywords
-            elif any(kw in target_lower or kw in source_lower for kw in medium_weight_keywords):
-                weights[target_body] = 10.0
-            # Default to low weight
-            else:
-                weights[target_body] = 0.0
-
-        return weights
+        if lowered is None:
+            lowered = AutoCalibration._lowercase_correspondences(correspondences)
+
+        # Match keywords against both names at once, for all bodies
+        target_bodies, combined = AutoCalibration._combined_names(lowered)
+
+        weights = np.select(
+            [
+                # High weight (100) for end effectors and pelvis (grounding)
+                _keyword_mask(combined, _HIGH_POS_KEYWORDS),
+                # Medium weight (10) for intermediate joints
+                _keyword_mask(combined, _MED_POS_KEYWORDS),
+            ],
+            [100.0, 10.0],
+            # Default to low weight (0) for rotation-only joints
+            default=0.0
+        )
+
+        return dict(zip(target_bodies, weights.tolist()))
 
     @staticmethod
     def suggest_rotation_weights(
-        correspondences: Dict[str, str]
+        correspondences: Dict[str, str],
+        lowered: Optional[List[Tuple[str, str, str, str]]] = None
     ) -> Dict[str, float]:
         """Suggest rotation weights based on body names.
 
         Args:
             correspondences: Body correspondences
+            lowered: Optional output of _lowercase_correspondences(correspondences),
+                to share the lowercasing with suggest_position_weights
 
         Returns:
             Dictionary mapping target body names to suggested rotation weights
         """
-        weights = {}
-
-        # Higher rotation weight for spine, shoulders (important orientation)
-        high_rot_keywords = ['spine', 'torso', 'shoulder']
-        # Very high for end effectors
-        very_high_rot_keywords = ['foot', 'toe', 'hand', 'wrist']
-        # Default is 10
-
-        for source_body, target_body in correspondences.items():
-            target_lower = target_body.lower()
-            source_lower = source_body.lower()
-
-            if any(kw in target_lower or kw in source_lower for kw in very_high_rot_keywords):
-                weights[target_body] = 50.0
-            elif any(kw in target_lower or kw in source_lower for kw in high_rot_keywords):
-                weights[target_body] = 100.0
-            else:
-                weights[target_body] = 10.0
-
-        return weights
+        if lowered is None:
+            lowered = AutoCalibration._lowercase_correspondences(correspondences)
+
+        # Match keywords against both names at once, for all bodies
+        target_bodies, combined = AutoCalibration._combined_names(lowered)
+
+        weights = np.select(
+            [
+                _keyword_mask(combined, _VHIGH_ROT_KEYWORDS),
+                _keyword_mask(combined, _HIGH_ROT_KEYWORDS),
+            ],
+            [50.0, 100.0],
+            default=10.0
+        )
+
+        return dict(zip(target_bodies, weights.tolist()))
@@ -4,8 +4,6 @@
 import argparse
 import sys
 
-from ik_config_editor.ik_config_editor_app import IKConfigEditorApp
-
 
 def main():
     """Main entry point for IK Config Editor CLI."""
@@ -74,6 +72,9 @@ Examples:
 
     args = parser.parse_args()
 
+    # Import the GUI only after argument parsing so --help stays fast
+    from ik_config_editor.ik_config_editor_app import IKConfigEditorApp
+
     # Create and run the application
     try:
         app = IKConfigEditorApp(
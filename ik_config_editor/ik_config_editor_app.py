@@ -1,15 +1,86 @@
 """Main GUI application for IK Config Editor."""
 
-import json
+import contextlib
+import functools
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 import open3d as o3d
 import open3d.visualization.gui as gui
 import open3d.visualization.rendering as rendering
 
+from ik_config_editor.json_io import read_json
 from ik_config_editor.skeleton_loader import SkeletonLoader
 from ik_config_editor.ik_config_generator import IKConfigGenerator
+from ik_config_editor.auto_calibration import AutoCalibration
+
+# Below this many bodies the NumPy path finishes long before numba would have
+# been imported and the kernel compiled, so numba is only used above it
+_NUMBA_MIN_BODIES = 10_000
+
+
+def _quat_batch_to_rot_numpy(quats, out):
+    """Write the rotation matrix of each (N, 4) [w, x, y, z] quaternion into out (N, 3, 3)."""
+    w, x, y, z = quats.T
+
+    out[:] = np.stack([
+        1 - 2*y*y - 2*z*z, 2*x*y - 2*w*z, 2*x*z + 2*w*y,
+        2*x*y + 2*w*z, 1 - 2*x*x - 2*z*z, 2*y*z - 2*w*x,
+        2*x*z - 2*w*y, 2*y*z + 2*w*x, 1 - 2*x*x - 2*y*y,
+    ], axis=-1).reshape(-1, 3, 3)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_quat_batch_to_rot_numba():
+    """Return the parallel numba conversion kernel, JIT-compiling it on first use.
+
+    numba is imported here instead of at module import since it is slow to
+    import and only needed for very large skeletons.
+
+    Returns:
+        The compiled kernel, or None if numba is not installed
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional
+        return None
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def quat_batch_to_rot(quats, out):
+        for i in prange(quats.shape[0]):
+            w = quats[i, 0]
+            x = quats[i, 1]
+            y = quats[i, 2]
+            z = quats[i, 3]
+
+            out[i, 0, 0] = 1 - 2*y*y - 2*z*z
+            out[i, 0, 1] = 2*x*y - 2*w*z
+            out[i, 0, 2] = 2*x*z + 2*w*y
+            out[i, 1, 0] = 2*x*y + 2*w*z
+            out[i, 1, 1] = 1 - 2*x*x - 2*z*z
+            out[i, 1, 2] = 2*y*z - 2*w*x
+            out[i, 2, 0] = 2*x*z - 2*w*y
+            out[i, 2, 1] = 2*y*z + 2*w*x
+            out[i, 2, 2] = 1 - 2*x*x - 2*y*y
+
+    return quat_batch_to_rot
+
+
+def _quat_batch_to_rot(quats, out):
+    """Convert (N, 4) quaternions into out (N, 3, 3), using numba for large N."""
+    if len(quats) >= _NUMBA_MIN_BODIES:
+        kernel = _get_quat_batch_to_rot_numba()
+        if kernel is not None:
+            kernel(quats, out)
+            return
+    _quat_batch_to_rot_numpy(quats, out)
+
+
+# Plain decimal number, as typed into the height field
+_FLOAT_RE = re.compile(r"\s*[+-]?(\d+\.?\d*|\.\d+)\s*")
 
 
 class IKConfigEditorApp:
@@ -50,11 +121,48 @@ class IKConfigEditorApp:
         # Data storage
         self.source_skeleton = None
         self.target_skeleton = None
+        # Skeletons packed into (N, 3) position / (N, 4) quaternion arrays at load time
+        self.source_arrays = None
+        self.target_arrays = None
+        # Merged coordinate-frame mesh buffers, built by the loader thread
+        self._source_mesh_buffers = None
+        self._target_mesh_buffers = None
+        # Body names sorted for the correspondence table, cached at load time
+        self._sorted_source_names = []
+        self._sorted_target_names = []
         self.correspondences = {}
+        # Reverse index: target body -> source bodies mapped to it
+        self._corr_target_to_sources = {}
+
+        # Correspondence table rows currently shown: source body -> (label, dropdown)
+        self._row_widgets = {}
+        self._table_source_bodies = []
+        self._table_target_bodies = []
+        # State the table was last rendered from, to skip no-op updates
+        self._last_table_key = None
         self.robot_root_name = "pelvis"
         self.human_root_name = "pelvis"
         self.human_height_assumption = 1.8
 
+        # Deferred refreshes while inside _batch_updates()
+        self._batch_depth = 0
+        self._dirty = set()
+
+        # Debounced height edits (see _on_height_changed)
+        self._pending_height_text = None
+        self._pending_height_timer = None
+
+        # Skeletons are loaded off the UI thread; a single worker keeps loads
+        # (and numba's parallel kernels) from running concurrently
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._load_ids = {"source": 0, "target": 0}
+
+        # Unit coordinate frame buffers, instanced per body when drawing skeletons
+        unit_frame = o3d.geometry.TriangleMesh.create_coordinate_frame(size=0.1)
+        self._unit_frame_verts = np.asarray(unit_frame.vertices).copy()
+        self._unit_frame_tris = np.asarray(unit_frame.triangles).copy()
+        self._unit_frame_colors = np.asarray(unit_frame.vertex_colors).copy()
+
         # XML paths for robot pose files
         self.source_xml_path = source_xml_path
         self.target_xml_path = target_xml_path
@@ -79,6 +187,30 @@ class IKConfigEditorApp:
         if target_path:
             self._load_target_skeleton_from_path(target_path, target_type)
 
+    @contextlib.contextmanager
+    def _batch_updates(self):
+        """Defer scene and correspondence table refreshes until the block exits.
+
+        Refresh requests made inside the block only mark their part dirty; when
+        the outermost block exits, each dirty part is rebuilt once and a single
+        redraw is posted.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                dirty = self._dirty
+                self._dirty = set()
+                if "source" in dirty:
+                    self._update_src_scene()
+                if "target" in dirty:
+                    self._update_tgt_scene()
+                if "table" in dirty:
+                    self._update_correspondence_table()
+                self.window.post_redraw()
+
     def _on_layout(self, layout_context):
         """Handle window layout."""
         r = self.window.content_rect
@@ -231,11 +363,31 @@ class IKConfigEditorApp:
         self.human_root_name = text
 
     def _on_height_changed(self, text):
-        """Handle human height change."""
-        try:
+        """Handle human height change.
+
+        Debounced: the value is parsed once typing pauses for 200 ms, so a burst
+        of keystrokes results in a single update.
+        """
+        self._pending_height_text = text
+        if self._pending_height_timer is not None:
+            self._pending_height_timer.cancel()
+        self._pending_height_timer = threading.Timer(0.2, self._commit_height)
+        self._pending_height_timer.daemon = True
+        self._pending_height_timer.start()
+
+    def _commit_height(self):
+        """Apply the pending height edit on the UI thread (debounce timer callback)."""
+        gui.Application.instance.post_to_main_thread(self.window, self._apply_pending_height)
+
+    def _apply_pending_height(self):
+        """Parse and store the latest height text, if any."""
+        text = self._pending_height_text
+        if text is None:
+            return
+        self._pending_height_text = None
+        # Ignore invalid input without raising (e.g. partially typed numbers)
+        if _FLOAT_RE.fullmatch(text):
             self.human_height_assumption = float(text)
-        except ValueError:
-            pass  # Ignore invalid input
 
     def _on_auto_offsets_changed(self, checked):
         """Handle auto-calculate offsets checkbox change."""
@@ -292,74 +444,106 @@ class IKConfigEditorApp:
         self._load_target_skeleton_from_path(path, "auto")
 
     def _load_source_skeleton_from_path(self, path, skeleton_type="auto"):
-        """Load source skeleton from file path."""
+        """Load source skeleton from file path in the background."""
         if os.path.exists(path):
-            try:
-                # Check if this is a robot pose JSON that needs XML path
-                needs_xml = False
-                if path.endswith('.json') and skeleton_type == "auto":
-                    with open(path, 'r') as f:
-                        data = json.load(f)
-                    if "joint_angles" in data:
-                        needs_xml = True
-
-                if needs_xml:
-                    # If XML path was provided, use it; otherwise prompt
-                    if self.source_xml_path:
-                        self.source_skeleton = SkeletonLoader.load(
-                            path, skeleton_type="robot_pose", robot_xml_path=self.source_xml_path
-                        )
-                        print(f"Loaded source skeleton from robot pose: {len(self.source_skeleton)} bodies")
-                        self._update_src_scene()
-                        self._update_correspondence_table()
-                    else:
-                        # Prompt for XML file
-                        self._prompt_for_source_xml(path)
-                else:
-                    # Load directly
-                    self.source_skeleton = SkeletonLoader.load(path, skeleton_type)
-                    print(f"Loaded source skeleton: {len(self.source_skeleton)} bodies")
-                    self._update_src_scene()
-                    self._update_correspondence_table()
-            except Exception as e:
-                print(f"Error loading source skeleton: {e}")
-                # Show error dialog
-                self._show_error_dialog(f"Failed to load source skeleton:\n{str(e)}")
+            self._submit_load("source", path, skeleton_type, self.source_xml_path)
 
     def _load_target_skeleton_from_path(self, path, skeleton_type="auto"):
-        """Load target skeleton from file path."""
+        """Load target skeleton from file path in the background."""
         if os.path.exists(path):
-            try:
-                # Check if this is a robot pose JSON that needs XML path
-                needs_xml = False
-                if path.endswith('.json') and skeleton_type == "auto":
-                    with open(path, 'r') as f:
-                        data = json.load(f)
-                    if "joint_angles" in data:
-                        needs_xml = True
-
-                if needs_xml:
-                    # If XML path was provided, use it; otherwise prompt
-                    if self.target_xml_path:
-                        self.target_skeleton = SkeletonLoader.load(
-                            path, skeleton_type="robot_pose", robot_xml_path=self.target_xml_path
-                        )
-                        print(f"Loaded target skeleton from robot pose: {len(self.target_skeleton)} bodies")
-                        self._update_tgt_scene()
-                        self._update_correspondence_table()
-                    else:
-                        # Prompt for XML file
-                        self._prompt_for_target_xml(path)
-                else:
-                    # Load directly
-                    self.target_skeleton = SkeletonLoader.load(path, skeleton_type)
-                    print(f"Loaded target skeleton: {len(self.target_skeleton)} bodies")
-                    self._update_tgt_scene()
-                    self._update_correspondence_table()
-            except Exception as e:
-                print(f"Error loading target skeleton: {e}")
-                # Show error dialog
-                self._show_error_dialog(f"Failed to load target skeleton:\n{str(e)}")
+            self._submit_load("target", path, skeleton_type, self.target_xml_path)
+
+    def _submit_load(self, side, path, skeleton_type, robot_xml_path, preloaded=None):
+        """Load a skeleton on the worker thread and finish on the UI thread.
+
+        Args:
+            side: "source" or "target"
+            path: Path to skeleton file
+            skeleton_type: Type of skeleton file
+            robot_xml_path: Path to robot XML (for robot pose files)
+            preloaded: Optional already parsed JSON content of path
+        """
+        # Only the latest load per side is applied
+        self._load_ids[side] += 1
+        load_id = self._load_ids[side]
+
+        future = self._executor.submit(
+            self._read_skeleton, path, skeleton_type, robot_xml_path, preloaded
+        )
+        future.add_done_callback(
+            lambda f: gui.Application.instance.post_to_main_thread(
+                self.window, functools.partial(self._finish_load, side, load_id, path, f)
+            )
+        )
+
+    def _read_skeleton(self, path, skeleton_type, robot_xml_path, preloaded):
+        """Load a skeleton and precompute its scene buffers (runs on the worker thread).
+
+        Returns:
+            Tuple of (skeleton, packed arrays, mesh buffers, parsed JSON). The
+            skeleton is None if the file is a robot pose that still needs its
+            robot XML.
+        """
+        # Check if this is a robot pose JSON that needs XML path
+        # (the parsed data is passed on so the file is only read once)
+        data = preloaded
+        if skeleton_type == "auto" and data is None and path.endswith('.json'):
+            data = read_json(path)
+        if skeleton_type == "auto" and data is not None and "joint_angles" in data:
+            if robot_xml_path is None:
+                return None, None, None, data
+            skeleton_type = "robot_pose"
+
+        skeleton = SkeletonLoader.load(
+            path, skeleton_type, robot_xml_path=robot_xml_path, preloaded=data
+        )
+        arrays = AutoCalibration.prepare(skeleton)
+        return skeleton, arrays, self._build_skeleton_mesh(arrays), data
+
+    def _finish_load(self, side, load_id, path, future):
+        """Apply a finished background load on the UI thread."""
+        if load_id != self._load_ids[side]:
+            return  # Superseded by a newer load
+
+        try:
+            skeleton, arrays, mesh_buffers, pose_data = future.result()
+        except Exception as e:
+            print(f"Error loading {side} skeleton: {e}")
+            # Show error dialog
+            self._show_error_dialog(f"Failed to load {side} skeleton:\n{str(e)}")
+            return
+
+        if skeleton is None:
+            # Prompt for XML file
+            if side == "source":
+                self._prompt_for_source_xml(path, pose_data)
+            else:
+                self._prompt_for_target_xml(path, pose_data)
+            return
+
+        print(f"Loaded {side} skeleton: {len(skeleton)} bodies")
+        with self._batch_updates():
+            if side == "source":
+                self._set_source_skeleton(skeleton, arrays, mesh_buffers)
+                self._update_src_scene()
+            else:
+                self._set_target_skeleton(skeleton, arrays, mesh_buffers)
+                self._update_tgt_scene()
+            self._update_correspondence_table()
+
+    def _set_source_skeleton(self, skeleton, arrays, mesh_buffers):
+        """Store a loaded source skeleton with its packed arrays, mesh and sorted names."""
+        self.source_skeleton = skeleton
+        self.source_arrays = arrays
+        self._source_mesh_buffers = mesh_buffers
+        self._sorted_source_names = sorted(arrays.names)
+
+    def _set_target_skeleton(self, skeleton, arrays, mesh_buffers):
+        """Store a loaded target skeleton with its packed arrays, mesh and sorted names."""
+        self.target_skeleton = skeleton
+        self.target_arrays = arrays
+        self._target_mesh_buffers = mesh_buffers
+        self._sorted_target_names = sorted(arrays.names)
 
     def _show_error_dialog(self, message):
         """Show an error dialog."""
@@ -379,9 +563,10 @@ class IKConfigEditorApp:
         """Handle error dialog OK button."""
         self.window.close_dialog()
 
-    def _prompt_for_source_xml(self, pose_json_path):
+    def _prompt_for_source_xml(self, pose_json_path, pose_data=None):
         """Prompt user to select XML file for source robot pose."""
         self.pending_source_pose_path = pose_json_path
+        self.pending_source_pose_data = pose_data
         filedlg = gui.FileDialog(gui.FileDialog.Mode.OPEN, "Select Source Robot XML", self.window.theme)
         filedlg.add_filter(".xml", "MuJoCo XML files")
         filedlg.add_filter("", "All files")
@@ -389,9 +574,10 @@ class IKConfigEditorApp:
         filedlg.set_on_done(self._on_source_xml_selected)
         self.window.show_dialog(filedlg)
 
-    def _prompt_for_target_xml(self, pose_json_path):
+    def _prompt_for_target_xml(self, pose_json_path, pose_data=None):
         """Prompt user to select XML file for target robot pose."""
         self.pending_target_pose_path = pose_json_path
+        self.pending_target_pose_data = pose_data
         filedlg = gui.FileDialog(gui.FileDialog.Mode.OPEN, "Select Target Robot XML", self.window.theme)
         filedlg.add_filter(".xml", "MuJoCo XML files")
         filedlg.add_filter("", "All files")
@@ -402,97 +588,151 @@ class IKConfigEditorApp:
     def _on_source_xml_selected(self, xml_path):
         """Handle source XML file selection."""
         self.window.close_dialog()
-        try:
-            self.source_xml_path = xml_path
-            self.source_skeleton = SkeletonLoader.load(
-                self.pending_source_pose_path,
-                skeleton_type="robot_pose",
-                robot_xml_path=xml_path
-            )
-            print(f"Loaded source skeleton from robot pose: {len(self.source_skeleton)} bodies")
-            self._update_src_scene()
-            self._update_correspondence_table()
-        except Exception as e:
-            print(f"Error loading source skeleton from robot pose: {e}")
-            self._show_error_dialog(f"Failed to load source skeleton:\n{str(e)}")
+        self.source_xml_path = xml_path
+        self._submit_load(
+            "source",
+            self.pending_source_pose_path,
+            "robot_pose",
+            xml_path,
+            preloaded=self.pending_source_pose_data
+        )
 
     def _on_target_xml_selected(self, xml_path):
         """Handle target XML file selection."""
         self.window.close_dialog()
-        try:
-            self.target_xml_path = xml_path
-            self.target_skeleton = SkeletonLoader.load(
-                self.pending_target_pose_path,
-                skeleton_type="robot_pose",
-                robot_xml_path=xml_path
-            )
-            print(f"Loaded target skeleton from robot pose: {len(self.target_skeleton)} bodies")
-            self._update_tgt_scene()
-            self._update_correspondence_table()
-        except Exception as e:
-            print(f"Error loading target skeleton from robot pose: {e}")
-            self._show_error_dialog(f"Failed to load target skeleton:\n{str(e)}")
+        self.target_xml_path = xml_path
+        self._submit_load(
+            "target",
+            self.pending_target_pose_path,
+            "robot_pose",
+            xml_path,
+            preloaded=self.pending_target_pose_data
+        )
 
     def _update_src_scene(self):
         """Update source scene with loaded skeleton."""
-        self._update_scene(self.src_scene, self.source_skeleton, "source")
+        if self._batch_depth:
+            self._dirty.add("source")
+            return
+        self._update_scene(self.src_scene, self.source_arrays, self._source_mesh_buffers, "source")
 
     def _update_tgt_scene(self):
         """Update target scene with loaded skeleton."""
-        self._update_scene(self.tgt_scene, self.target_skeleton, "target")
+        if self._batch_depth:
+            self._dirty.add("target")
+            return
+        self._update_scene(self.tgt_scene, self.target_arrays, self._target_mesh_buffers, "target")
 
-    def _update_scene(self, scene, skeleton, name):
+    def _update_scene(self, scene, skeleton, mesh_buffers, name):
         """Update a scene with skeleton data."""
         scene.scene.clear_geometry()
 
-        if skeleton is None:
+        if skeleton is None or not skeleton.names:
             return
 
         # Add skeleton to scene
-        self._add_skeleton_to_scene(scene, skeleton, name)
-
-        # Setup camera to fit skeleton
-        bounds = scene.scene.bounding_box
-        center = bounds.get_center()
+        self._add_skeleton_to_scene(scene, skeleton, mesh_buffers, name)
+
+        # Setup camera to fit skeleton, bounding the body positions directly
+        # (padded to cover the coordinate frames) instead of walking the scene
+        bb_min = skeleton.positions.min(axis=0) - 0.2
+        bb_max = skeleton.positions.max(axis=0) + 0.2
+        bounds = o3d.geometry.AxisAlignedBoundingBox(bb_min, bb_max)
+        center = (bb_min + bb_max) / 2
         scene.setup_camera(60, bounds, center)
 
-    def _add_skeleton_to_scene(self, scene, skeleton, name):
-        """Add skeleton visualization to scene."""
-        for body_name, data in skeleton.items():
-            position = np.array(data["position"])
-            orientation = np.array(data["orientation"])  # [w, x, y, z]
+    def _build_skeleton_mesh(self, skeleton):
+        """Build the merged coordinate-frame mesh buffers for a packed skeleton.
 
-            # Create coordinate frame at body position
-            frame = o3d.geometry.TriangleMesh.create_coordinate_frame(
-                size=0.1, origin=position
-            )
+        Pure NumPy, so it can run on the loader thread.
 
-            # Rotate frame by orientation quaternion
-            # Convert quaternion [w,x,y,z] to rotation matrix
-            rotation_matrix = self._quaternion_to_rotation_matrix(orientation)
-            frame.rotate(rotation_matrix, center=position)
+        Returns:
+            Tuple of (vertices (B*V, 3), triangles (B*T, 3), vertex colors (B*V, 3))
+        """
+        positions = skeleton.positions
+        orientations = skeleton.orientations  # [w, x, y, z]
+
+        # Convert all quaternions to rotation matrices in one vectorized pass
+        rotation_matrices = self._quaternions_to_matrices(orientations)
+
+        # Unit coordinate frame at the origin, instanced once per body below
+        unit_verts = self._unit_frame_verts
+        unit_tris = self._unit_frame_tris
+        unit_colors = self._unit_frame_colors
+        num_bodies = len(skeleton.names)
+        num_verts = len(unit_verts)
+
+        # Merge all body frames into a single mesh so the scene gets one geometry:
+        # rotate every frame by its orientation and move it to its body position
+        verts = (
+            np.einsum('bij,vj->bvi', rotation_matrices, unit_verts) + positions[:, None, :]
+        ).reshape(-1, 3)
+        tris = (
+            unit_tris[None] + (np.arange(num_bodies, dtype=np.int32) * num_verts)[:, None, None]
+        ).reshape(-1, 3)
+        colors = np.tile(unit_colors, (num_bodies, 1))
+
+        return verts, tris, colors
+
+    def _add_skeleton_to_scene(self, scene, skeleton, mesh_buffers, name):
+        """Add skeleton visualization to scene from its packed arrays and mesh buffers."""
+        if not skeleton.names:
+            return
 
-            # Add frame to scene
-            mat = rendering.MaterialRecord()
-            mat.shader = "defaultUnlit"
-            scene.scene.add_geometry(f"{name}_{body_name}_frame", frame, mat)
+        verts, tris, colors = mesh_buffers
+        skeleton_mesh = o3d.geometry.TriangleMesh(
+            o3d.utility.Vector3dVector(verts), o3d.utility.Vector3iVector(tris)
+        )
+        skeleton_mesh.vertex_colors = o3d.utility.Vector3dVector(colors)
 
-            # Add text label for body name
-            scene.add_3d_label(position, body_name)
+        mat = rendering.MaterialRecord()
+        mat.shader = "defaultUnlit"
+        scene.scene.add_geometry(f"{name}_skeleton", skeleton_mesh, mat)
 
-    def _quaternion_to_rotation_matrix(self, q):
-        """Convert quaternion [w, x, y, z] to 3x3 rotation matrix."""
-        w, x, y, z = q
+        # Add text labels for body names
+        for body_name, position in zip(skeleton.names, skeleton.positions):
+            scene.add_3d_label(position, body_name)
 
-        return np.array([
-            [1 - 2*y*y - 2*z*z, 2*x*y - 2*w*z, 2*x*z + 2*w*y],
-            [2*x*y + 2*w*z, 1 - 2*x*x - 2*z*z, 2*y*z - 2*w*x],
-            [2*x*z - 2*w*y, 2*y*z + 2*w*x, 1 - 2*x*x - 2*y*y]
-        ])
+    @staticmethod
+    def _quaternions_to_matrices(quats):
+        """Convert (N, 4) quaternions [w, x, y, z] to (N, 3, 3) rotation matrices."""
+        quats = np.ascontiguousarray(quats, dtype=np.float64).reshape(-1, 4)
+        out = np.empty((len(quats), 3, 3))
+        _quat_batch_to_rot(quats, out)
+        return out
 
     def _update_correspondence_table(self):
         """Update the correspondence table UI."""
+        if self._batch_depth:
+            self._dirty.add("table")
+            return
+
+        # Nothing the table shows has changed since the last update
+        table_key = (
+            self._sorted_source_names if self.source_skeleton else None,
+            self._sorted_target_names if self.target_skeleton else None,
+            frozenset(self.correspondences.items()),
+        )
+        if table_key == self._last_table_key:
+            return
+        self._last_table_key = table_key
+
+        if self.source_skeleton and self.target_skeleton:
+            # Source and target bodies sorted alphabetically when loaded
+            sorted_source_bodies = self._sorted_source_names
+            sorted_target_bodies = self._sorted_target_names
+            # Dropdown index per target body (+1 because index 0 is the empty option)
+            target_index = {name: i + 1 for i, name in enumerate(sorted_target_bodies)}
+
+            # Same source rows as the table on screen: patch the dropdowns in place
+            if self._row_widgets and sorted_source_bodies == self._table_source_bodies:
+                self._refresh_correspondence_rows(sorted_target_bodies, target_index)
+                return
+
         table_layout = gui.Vert(0, gui.Margins(0, 0, 0, 0))
+        self._row_widgets = {}
+        self._table_source_bodies = []
+        self._table_target_bodies = []
 
         if self.source_skeleton and self.target_skeleton:
             em = self.window.theme.font_size
@@ -511,9 +751,6 @@ class IKConfigEditorApp:
 
             table_layout.add_child(grid)
 
-            # Sort source bodies alphabetically
-            sorted_source_bodies = sorted(self.source_skeleton.keys())
-
             # Add rows for each source body using grid
             for source_body in sorted_source_bodies:
                 # Source body label
@@ -523,36 +760,29 @@ class IKConfigEditorApp:
                 # Dropdown for target selection
                 target_dropdown = gui.Combobox()
 
-                # Create closure to capture source_body
-                def make_callback(src_body):
-                    def callback(text, index):
-                        if text == "":
-                            # Remove correspondence
-                            self.correspondences.pop(src_body, None)
-                        else:
-                            # Add/update correspondence
-                            self.correspondences[src_body] = text
-                        print(f"Correspondence: {src_body} → {text if text else '(none)'}")
-                    return callback
-
-                target_dropdown.set_on_selection_changed(make_callback(source_body))
+                # Open3D passes only (text, index), so bind the row's source body
+                target_dropdown.set_on_selection_changed(
+                    functools.partial(self._on_correspondence_selected, source_body)
+                )
 
                 # Populate dropdown with target bodies
                 target_dropdown.add_item("")  # Empty option to remove mapping
-                sorted_target_bodies = sorted(self.target_skeleton.keys())
                 for target_body in sorted_target_bodies:
                     target_dropdown.add_item(target_body)
 
                 # Set current selection if exists
                 if source_body in self.correspondences:
                     target_name = self.correspondences[source_body]
-                    if target_name in sorted_target_bodies:
-                        # +1 because index 0 is the empty option
-                        target_dropdown.selected_index = sorted_target_bodies.index(target_name) + 1
+                    if target_name in target_index:
+                        target_dropdown.selected_index = target_index[target_name]
 
                 # Add to grid
                 grid.add_child(source_label)
                 grid.add_child(target_dropdown)
+                self._row_widgets[source_body] = (source_label, target_dropdown)
+
+            self._table_source_bodies = sorted_source_bodies
+            self._table_target_bodies = sorted_target_bodies
 
         elif self.source_skeleton:
             info_label = gui.Label("Load target skeleton to create mappings")
@@ -570,6 +800,56 @@ class IKConfigEditorApp:
         # Update the proxy widget
         self.correspondence_table_proxy.set_widget(table_layout)
 
+    def _on_correspondence_selected(self, source_body, text, index):
+        """Handle a target selection in a correspondence row dropdown."""
+        # Empty text removes the correspondence
+        self._set_correspondence(source_body, text)
+        print(f"Correspondence: {source_body} → {text if text else '(none)'}")
+
+    def _refresh_correspondence_rows(self, sorted_target_bodies, target_index):
+        """Update the existing correspondence rows in place.
+
+        Open3D layouts cannot remove individual children, so rows are reused
+        whenever the set of source bodies is unchanged. Dropdown items are only
+        repopulated if the target bodies changed.
+        """
+        targets_changed = sorted_target_bodies != self._table_target_bodies
+
+        for source_body, (_, target_dropdown) in self._row_widgets.items():
+            if targets_changed:
+                target_dropdown.clear_items()
+                target_dropdown.add_item("")  # Empty option to remove mapping
+                for target_body in sorted_target_bodies:
+                    target_dropdown.add_item(target_body)
+
+            target_dropdown.selected_index = target_index.get(
+                self.correspondences.get(source_body), 0
+            )
+
+        self._table_target_bodies = sorted_target_bodies
+        self.window.post_redraw()
+
+    def _set_correspondence(self, source_body, target_body):
+        """Map a source body to a target body, or remove its mapping if target_body is empty.
+
+        Keeps the target -> sources reverse index in sync with self.correspondences.
+        """
+        old_target = self.correspondences.get(source_body)
+        if old_target is not None:
+            sources = self._corr_target_to_sources.get(old_target)
+            if sources is not None:
+                sources.discard(source_body)
+                if not sources:
+                    del self._corr_target_to_sources[old_target]
+
+        if target_body:
+            # Add/update correspondence
+            self.correspondences[source_body] = target_body
+            self._corr_target_to_sources.setdefault(target_body, set()).add(source_body)
+        else:
+            # Remove correspondence
+            self.correspondences.pop(source_body, None)
+
     def _on_export_clicked(self):
         """Handle export button click."""
         if not self.source_skeleton or not self.target_skeleton:
@@ -580,6 +860,22 @@ class IKConfigEditorApp:
             self._show_error_dialog("Please create at least one body correspondence.")
             return
 
+        # IK tables are keyed by target body, so a target mapped from several
+        # source bodies would silently keep only one of them
+        shared_targets = sorted(
+            (target_body, sorted(sources))
+            for target_body, sources in self._corr_target_to_sources.items()
+            if len(sources) > 1
+        )
+        if shared_targets:
+            lines = "\n".join(
+                f"{target_body} <- {', '.join(sources)}" for target_body, sources in shared_targets
+            )
+            self._show_error_dialog(
+                f"Each target body can only be mapped from one source body:\n{lines}"
+            )
+            return
+
         # Show file save dialog
         filedlg = gui.FileDialog(gui.FileDialog.Mode.SAVE, "Save IK Config", self.window.theme)
         filedlg.add_filter(".json", "JSON files")
@@ -596,6 +892,11 @@ class IKConfigEditorApp:
         if not path.endswith('.json'):
             path += '.json'
 
+        # Apply a height edit still waiting on the debounce timer
+        if self._pending_height_timer is not None:
+            self._pending_height_timer.cancel()
+        self._apply_pending_height()
+
         try:
             # Create IK config generator with Phase 2 features
             generator = IKConfigGenerator(
@@ -612,8 +913,8 @@ class IKConfigEditorApp:
                 use_limb_scaling=self.use_limb_scaling,
             )
 
-            # Save config
-            generator.save(path)
+            # Save config (indented, since exported configs are read and edited by hand)
+            generator.save(path, pretty=True)
 
             # Build success message
             msg = f"IK config saved to:\n{path}\n\n{len(self.correspondences)} correspondences"
@@ -647,6 +948,7 @@ class IKConfigEditorApp:
     def run(self):
         """Run the application."""
         self.app.run()
+        self._executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,60 @@
 """IK Configuration Generator for creating GMR-compatible IK config JSON files."""
 
 import json
+from collections import OrderedDict
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional
 
-from ik_config_editor.auto_calibration import AutoCalibration
+from ik_config_editor.auto_calibration import AutoCalibration, PreparedSkeleton
+from ik_config_editor.json_io import orjson
+
+
+# Recent calibration results, shared between generators built from the same
+# skeletons and correspondences (e.g. when the editor exports again after a
+# flag change). Keys hold skeleton contents rather than the skeleton objects,
+# so an edited skeleton never matches a stale entry and old skeletons are not
+# kept alive.
+_CALIBRATION_CACHE: "OrderedDict[tuple, Any]" = OrderedDict()
+_CALIBRATION_CACHE_SIZE = 32
+
+
+def _skeleton_key(prepared: PreparedSkeleton) -> tuple:
+    """Build a hashable key from the contents of a prepared skeleton.
+
+    Args:
+        prepared: Skeleton packed by AutoCalibration.prepare
+
+    Returns:
+        Tuple of body names and the raw position and orientation bytes
+    """
+    return (
+        tuple(prepared.names),
+        prepared.positions.tobytes(),
+        prepared.orientations.tobytes(),
+    )
+
+
+def _cached_calibration(kind: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Return a cached calibration result, computing and storing it on a miss.
+
+    Args:
+        kind: Name of the calculation
+        key: Hashable inputs of the calculation (including skeleton keys)
+        compute: Computes the result on a cache miss
+
+    Returns:
+        The calculation result
+    """
+    cache_key = (kind, key)
+    if cache_key in _CALIBRATION_CACHE:
+        _CALIBRATION_CACHE.move_to_end(cache_key)
+        return _CALIBRATION_CACHE[cache_key]
+
+    result = compute()
+    _CALIBRATION_CACHE[cache_key] = result
+    if len(_CALIBRATION_CACHE) > _CALIBRATION_CACHE_SIZE:
+        _CALIBRATION_CACHE.popitem(last=False)
+    return result
 
 
 class IKConfigGenerator:
@@ -67,28 +117,67 @@ class IKConfigGenerator:
         self.position_weights = None
         self.rotation_weights = None
 
+        # Results are reused from earlier generators with the same inputs
+        correspondences_key = frozenset(correspondences.items())
+
+        if self.auto_calculate_offsets or self.auto_calculate_scales:
+            # Pack each skeleton once and share it across the calibration passes
+            prepared_source = AutoCalibration.prepare(source_skeleton)
+            prepared_target = AutoCalibration.prepare(target_skeleton)
+            skeletons_key = (_skeleton_key(prepared_source), _skeleton_key(prepared_target))
+
         if self.auto_calculate_offsets:
-            self.rotation_offsets = AutoCalibration.calculate_all_rotation_offsets(
-                source_skeleton, target_skeleton, correspondences
-            )
+            def calculate_offsets():
+                offsets = AutoCalibration.calculate_all_rotation_offsets(
+                    prepared_source, prepared_target, correspondences
+                )
+                # The cached arrays are shared by every later generator; freeze
+                # them so no generator can alter another's offsets
+                for offset in offsets.values():
+                    offset.flags.writeable = False
+                return offsets
+
+            # Each generator gets its own writable copy of the cached offsets
+            self.rotation_offsets = {
+                target_body: offset.copy()
+                for target_body, offset in _cached_calibration(
+                    "rotation_offsets", (skeletons_key, correspondences_key), calculate_offsets
+                ).items()
+            }
 
         if self.auto_calculate_scales:
             # Calculate height-based scaling
             if self.use_height_scaling:
-                self.height_scale = AutoCalibration.calculate_height_scale(
-                    source_skeleton, target_skeleton,
-                    human_root_name, robot_root_name
+                self.height_scale = _cached_calibration(
+                    "height_scale", (skeletons_key, human_root_name, robot_root_name),
+                    lambda: AutoCalibration.calculate_height_scale(
+                        prepared_source, prepared_target,
+                        human_root_name, robot_root_name
+                    )
                 )
 
             # Calculate per-limb scaling
             if self.use_limb_scaling:
-                self.scale_factors = AutoCalibration.calculate_limb_scales(
-                    source_skeleton, target_skeleton, correspondences
-                )
+                self.scale_factors = dict(_cached_calibration(
+                    "limb_scales", (skeletons_key, correspondences_key),
+                    lambda: AutoCalibration.calculate_limb_scales(
+                        prepared_source, prepared_target, correspondences
+                    )
+                ))
 
         if self.auto_suggest_weights:
-            self.position_weights = AutoCalibration.suggest_position_weights(correspondences)
-            self.rotation_weights = AutoCalibration.suggest_rotation_weights(correspondences)
+            def suggest_weights():
+                lowered = AutoCalibration._lowercase_correspondences(correspondences)
+                return (
+                    AutoCalibration.suggest_position_weights(correspondences, lowered),
+                    AutoCalibration.suggest_rotation_weights(correspondences, lowered),
+                )
+
+            position_weights, rotation_weights = _cached_calibration(
+                "weights", correspondences_key, suggest_weights
+            )
+            self.position_weights = dict(position_weights)
+            self.rotation_weights = dict(rotation_weights)
 
     def generate(self) -> Dict[str, Any]:
         """Generate the IK configuration dictionary.
@@ -109,74 +198,108 @@ class IKConfigGenerator:
         }
 
         # Build human_scale_table
-        for source_name in self.correspondences.keys():
-            # Start with base scale
-            scale = 1.0
-
-            # Apply height-based uniform scaling
-            if self.height_scale is not None:
-                scale *= self.height_scale
+        if self.height_scale is None and not self.scale_factors:
+            # No scaling calculated: every body keeps a scale of 1.0
+            config["human_scale_table"] = dict.fromkeys(self.correspondences, 1.0)
+        else:
+            # Height-based uniform scaling times per-limb scaling adjustments,
+            # as one vector multiply
+            source_names = list(self.correspondences.keys())
+            height_scale = self.height_scale if self.height_scale is not None else 1.0
+            scale_factors = self.scale_factors or {}
+            limb_scales = np.fromiter(
+                (scale_factors.get(name, 1.0) for name in source_names),
+                dtype=np.float64, count=len(source_names)
+            )
+            scales = height_scale * limb_scales
+            config["human_scale_table"] = dict(zip(source_names, scales.tolist()))
 
-            # Apply per-limb scaling adjustments
-            if self.scale_factors and source_name in self.scale_factors:
-                scale *= self.scale_factors[source_name]
+        # Build ik_match_table1 and ik_match_table2
+        identity = [1.0, 0.0, 0.0, 0.0]  # Identity quaternion
+        zero_offset = [0.0, 0.0, 0.0]  # Position offset (zero for now)
+        correspondence_items = list(self.correspondences.items())
 
-            config["human_scale_table"][source_name] = float(scale)
+        if not (self.position_weights or self.rotation_weights or self.rotation_offsets):
+            # Nothing calculated: every entry uses the default weights and identity offset
+            pos_weight = float(self.default_pos_weight)
+            rot_weight = float(self.default_rot_weight)
+            rot_weight2 = rot_weight * 0.5  # Half rotation weight for table2
+            config["ik_match_table1"] = {
+                target_name: [source_name, pos_weight, rot_weight, zero_offset, identity]
+                for source_name, target_name in correspondence_items
+            }
+            config["ik_match_table2"] = {
+                target_name: [source_name, pos_weight, rot_weight2, zero_offset, identity]
+                for source_name, target_name in correspondence_items
+            }
+            return config
 
-        # Build ik_match_table1 and ik_match_table2
-        for source_name, target_name in self.correspondences.items():
-            # Determine weights
-            if self.position_weights and target_name in self.position_weights:
-                pos_weight = float(self.position_weights[target_name])
-            else:
-                pos_weight = self.default_pos_weight
+        # Bind lookups to locals and convert all rotation offsets up front
+        position_weights = self.position_weights or {}
+        rotation_weights = self.rotation_weights or {}
+        rotation_offsets = {
+            name: offset.tolist() for name, offset in (self.rotation_offsets or {}).items()
+        }
+        default_pos_weight = self.default_pos_weight
+        default_rot_weight = self.default_rot_weight
 
-            if self.rotation_weights and target_name in self.rotation_weights:
-                rot_weight = float(self.rotation_weights[target_name])
-            else:
-                rot_weight = self.default_rot_weight
+        # Weights for all correspondences as vectors
+        target_names = [target_name for _, target_name in correspondence_items]
+        count = len(target_names)
+        pos_weights = np.fromiter(
+            (position_weights.get(name, default_pos_weight) for name in target_names),
+            dtype=np.float64, count=count
+        )
+        rot_weights = np.fromiter(
+            (rotation_weights.get(name, default_rot_weight) for name in target_names),
+            dtype=np.float64, count=count
+        )
+        # For table2, typically use lower rotation weights
+        rot_weights2 = rot_weights * 0.5  # Half rotation weight for table2
 
-            # Determine rotation offset
-            if self.rotation_offsets and target_name in self.rotation_offsets:
-                rot_offset = self.rotation_offsets[target_name].tolist()
-            else:
-                rot_offset = [1.0, 0.0, 0.0, 0.0]  # Identity quaternion
-
-            # Create table entry for table1
-            table_entry1 = [
-                source_name,                    # Source body name
-                pos_weight,                     # Position weight
-                rot_weight,                     # Rotation weight
-                [0.0, 0.0, 0.0],               # Position offset (zero for now)
-                rot_offset,                     # Rotation offset
-            ]
-
-            # Create table entry for table2 (can differ from table1 in weights)
-            # For table2, typically use lower rotation weights
-            table_entry2 = [
-                source_name,
-                pos_weight,
-                rot_weight * 0.5,  # Half rotation weight for table2
-                [0.0, 0.0, 0.0],
-                rot_offset,
-            ]
-
-            config["ik_match_table1"][target_name] = table_entry1
-            config["ik_match_table2"][target_name] = table_entry2
+        # Entries of both tables share the offset lists (never mutated before encoding)
+        table1 = config["ik_match_table1"]
+        table2 = config["ik_match_table2"]
+        for (source_name, target_name), pos_weight, rot_weight, rot_weight2 in zip(
+            correspondence_items, pos_weights.tolist(), rot_weights.tolist(), rot_weights2.tolist()
+        ):
+            rot_offset = rotation_offsets.get(target_name, identity)
+            # [source body, position weight, rotation weight, position offset, rotation offset]
+            table1[target_name] = [source_name, pos_weight, rot_weight, zero_offset, rot_offset]
+            table2[target_name] = [source_name, pos_weight, rot_weight2, zero_offset, rot_offset]
 
         return config
 
-    def save(self, output_path: str, indent: int = 4):
+    def save(self, output_path: str, indent: Optional[int] = None, pretty: bool = False):
         """Generate and save the IK configuration to a JSON file.
 
+        The file is written compact unless an indent or pretty is given.
+
         Args:
             output_path: Path where to save the JSON file
-            indent: JSON indentation level
+            indent: JSON indentation level (orjson is used for 2 or compact when installed)
+            pretty: Pretty-print with an indent of 4 if no indent is given
         """
         config = self.generate()
 
-        with open(output_path, 'w') as f:
-            json.dump(config, f, indent=indent)
+        if indent is None and pretty:
+            indent = 4
+
+        # orjson only supports compact or 2-space output
+        if orjson is not None and indent in (None, 2):
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(config, option=option))
+        else:
+            # Encode up front and write once: json.dump issues a write per chunk
+            if indent is None:
+                text = json.dumps(config, separators=(',', ':'))
+            else:
+                text = json.dumps(config, indent=indent)
+            with open(output_path, 'w') as f:
+                f.write(text)
 
         print(f"IK configuration saved to: {output_path}")
         print(f"  - {len(self.correspondences)} body correspondences")
@@ -0,0 +1,35 @@
+"""JSON file reading shared by the editor, loaders and validation scripts."""
+
+import json
+import mmap
+import os
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+
+def read_json(path: str, mmap_threshold: Optional[int] = None) -> Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    Args:
+        path: Path to the JSON file
+        mmap_threshold: With orjson, files larger than this many bytes are
+            memory-mapped so the parser reads straight from the page cache
+            instead of from a copy of the whole file (None never maps)
+
+    Returns:
+        The parsed JSON value
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if mmap_threshold is not None and os.fstat(f.fileno()).st_size > mmap_threshold:
+                # orjson takes a memoryview but not the mmap object itself
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
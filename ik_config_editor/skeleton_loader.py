@@ -1,18 +1,100 @@
 """Skeleton loader module for loading skeleton data from various sources."""
 
-import json
-from typing import Dict, Tuple, List
+import functools
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Dict, Tuple, List, Optional
 import numpy as np
 
+from ik_config_editor.json_io import read_json
+
+
+def _load_mj_model(xml_path: str):
+    """Load a MuJoCo model, reusing the cached one while the XML is unmodified.
+
+    Returns:
+        Tuple of (model, names of the named bodies, their body ids,
+        {joint name: qpos address})
+    """
+    return _load_mj_model_cached(xml_path, os.path.getmtime(xml_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_mj_model_cached(xml_path: str, mtime: float):
+    """Cached body of _load_mj_model, keyed by XML path and modification time."""
+    import mujoco as mj
+
+    model = mj.MjModel.from_xml_path(xml_path)
+    # mj_id2name skips the per-element accessor objects (None means unnamed).
+    # Unnamed bodies and joints cannot be referenced by name, so they are left out
+    id2name = mj.mj_id2name
+    body_ids = []
+    body_names = []
+    for body_id in range(model.nbody):
+        body_name = id2name(model, mj.mjtObj.mjOBJ_BODY, body_id)
+        if body_name:
+            body_ids.append(body_id)
+            body_names.append(body_name)
+    joint_qposadr = {}
+    for joint_id, qposadr in enumerate(model.jnt_qposadr.tolist()):
+        joint_name = id2name(model, mj.mjtObj.mjOBJ_JOINT, joint_id)
+        if joint_name:
+            joint_qposadr[joint_name] = qposadr
+    return model, tuple(body_names), np.array(body_ids, dtype=np.intp), joint_qposadr
+
+
+@dataclass(eq=False)
+class Skeleton(Mapping):
+    """Skeleton stored as parallel arrays (one row per body).
+
+    Also reads as the legacy unified format,
+    {body_name: {"position": [x,y,z], "orientation": [w,x,y,z]}}, so code that
+    indexes or iterates skeletons by body name keeps working. Entries are
+    views into the arrays rather than lists.
+    """
+
+    names: List[str]
+    positions: np.ndarray     # (N, 3)
+    orientations: np.ndarray  # (N, 4) quaternions [w, x, y, z]
+    name_to_idx: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.positions = np.asarray(self.positions, dtype=np.float64).reshape(-1, 3)
+        self.orientations = np.asarray(self.orientations, dtype=np.float64).reshape(-1, 4)
+        self.name_to_idx = {name: i for i, name in enumerate(self.names)}
+
+    def __eq__(self, other):
+        # Mapping.__eq__ would compare the per-body dicts of arrays, which is ambiguous
+        if not isinstance(other, Skeleton):
+            return NotImplemented
+        return (self.names == other.names
+                and np.array_equal(self.positions, other.positions)
+                and np.array_equal(self.orientations, other.orientations))
+
+    def __getitem__(self, name: str) -> Dict[str, np.ndarray]:
+        i = self.name_to_idx[name]
+        return {"position": self.positions[i], "orientation": self.orientations[i]}
+
+    def __contains__(self, name) -> bool:
+        return name in self.name_to_idx
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
 
 class SkeletonLoader:
     """Load skeleton data from various sources into a unified format.
 
-    Unified format: {body_name: {"position": [x,y,z], "orientation": [w,x,y,z]}}
+    Unified format: Skeleton with body names, (N, 3) positions and (N, 4)
+    orientations [w, x, y, z]
     """
 
     @staticmethod
-    def from_json(path: str) -> Dict[str, Dict[str, List[float]]]:
+    def from_json(path: str, preloaded: Optional[dict] = None) -> Skeleton:
         """Load skeleton from JSON file.
 
         Expected JSON format (from generate_mjcf_skeleton.py or generate_smpl_skeleton.py):
@@ -23,55 +105,46 @@ class SkeletonLoader:
 
         Args:
             path: Path to JSON file
+            preloaded: Already-parsed contents of the file, to skip re-reading it
 
         Returns:
-            Dictionary mapping body names to position and orientation
+            Skeleton with body names, positions and orientations
         """
-        with open(path, 'r') as f:
-            data = json.load(f)
-
-        # Convert to unified format
-        skeleton = {}
-        for body_name, (position, orientation) in data.items():
-            skeleton[body_name] = {
-                "position": list(position) if isinstance(position, (list, tuple, np.ndarray)) else position,
-                "orientation": list(orientation) if isinstance(orientation, (list, tuple, np.ndarray)) else orientation
-            }
-
-        return skeleton
+        if preloaded is not None:
+            data = preloaded
+        else:
+            data = read_json(path)
+
+        # Convert to unified format with one array per field
+        entries = data.values()
+        return Skeleton(
+            list(data),
+            np.asarray([position for position, _ in entries], dtype=np.float64),
+            np.asarray([orientation for _, orientation in entries], dtype=np.float64),
+        )
 
     @staticmethod
-    def from_mjcf(xml_path: str) -> Dict[str, Dict[str, List[float]]]:
+    def from_mjcf(xml_path: str) -> Skeleton:
         """Load skeleton directly from MuJoCo XML file.
 
         Args:
             xml_path: Path to MuJoCo XML file
 
         Returns:
-            Dictionary mapping body names to position and orientation
+            Skeleton with body names, positions and orientations
         """
         import mujoco as mj
 
-        # Load model and initialize data
-        model = mj.MjModel.from_xml_path(xml_path)
+        # Load model (cached per path) and initialize data
+        model, body_names, body_ids, _ = _load_mj_model(xml_path)
         data = mj.MjData(model)
         mj.mj_forward(model, data)
 
-        skeleton = {}
-        for body_id in range(model.nbody):
-            body = model.body(body_id)
-            position = data.xpos[body_id].tolist()
-            orientation = data.xquat[body_id].tolist()
-
-            skeleton[body.name] = {
-                "position": position,
-                "orientation": orientation
-            }
-
-        return skeleton
+        # Gather all named body poses in bulk; body names come from the model cache
+        return Skeleton(list(body_names), data.xpos[body_ids], data.xquat[body_ids])
 
     @staticmethod
-    def from_smplx(npz_path: str, body_model_path: str) -> Dict[str, Dict[str, List[float]]]:
+    def from_smplx(npz_path: str, body_model_path: str) -> Skeleton:
         """Load skeleton from SMPL-X file in rest pose.
 
         Args:
@@ -79,30 +152,32 @@ class SkeletonLoader:
             body_model_path: Path to SMPL-X body model directory
 
         Returns:
-            Dictionary mapping body names to position and orientation
+            Skeleton with body names, positions and orientations
         """
+        import torch
         from general_motion_retargeting.utils.smpl import load_smplx_file, get_smplx_data
 
-        # Load SMPL-X data and model
-        smplx_data, body_model, smplx_output, human_height = load_smplx_file(
-            npz_path, body_model_path
+        # Inference only: skip building the autograd graph for the body model pass
+        with torch.no_grad():
+            # Load SMPL-X data and model (runs the single body model forward pass)
+            smplx_data, body_model, smplx_output, human_height = load_smplx_file(
+                npz_path, body_model_path
+            )
+
+            # Get joint positions and orientations for the first frame
+            skeleton_data = get_smplx_data(smplx_data, body_model, smplx_output, curr_frame=0)
+
+        # Convert to unified format with one array per field
+        entries = skeleton_data.values()
+        return Skeleton(
+            list(skeleton_data),
+            np.asarray([np.asarray(position) for position, _ in entries], dtype=np.float64),
+            np.asarray([np.asarray(orientation) for _, orientation in entries], dtype=np.float64),
         )
 
-        # Get joint positions and orientations for the first frame
-        skeleton_data = get_smplx_data(smplx_data, body_model, smplx_output, curr_frame=0)
-
-        # Convert to unified format
-        skeleton = {}
-        for joint_name, (position, orientation) in skeleton_data.items():
-            skeleton[joint_name] = {
-                "position": position.tolist() if hasattr(position, 'tolist') else list(position),
-                "orientation": orientation.tolist() if hasattr(orientation, 'tolist') else list(orientation)
-            }
-
-        return skeleton
-
     @staticmethod
-    def from_robot_pose(pose_json_path: str, robot_xml_path: str) -> Dict[str, Dict[str, List[float]]]:
+    def from_robot_pose(pose_json_path: str, robot_xml_path: str,
+                        preloaded: Optional[dict] = None) -> Skeleton:
         """Load skeleton from robot pose JSON file by computing forward kinematics.
 
         This method takes a robot pose file containing joint angles and root pose,
@@ -117,23 +192,26 @@ class SkeletonLoader:
                     "joint_angles": {"joint_name": angle, ...}
                 }
             robot_xml_path: Path to the robot's MuJoCo XML file
+            preloaded: Already-parsed contents of the pose file, to skip re-reading it
 
         Returns:
-            Dictionary mapping body names to position and orientation
+            Skeleton with body names, positions and orientations
         """
         import mujoco as mj
 
         # Load the robot pose JSON
-        with open(pose_json_path, 'r') as f:
-            pose_data = json.load(f)
+        if preloaded is not None:
+            pose_data = preloaded
+        else:
+            pose_data = read_json(pose_json_path)
 
         # Extract root position, root quaternion, and joint angles
         root_position = np.array(pose_data["root_position"])
         root_quaternion = np.array(pose_data["root_quaternion"])  # [w, x, y, z]
         joint_angles = pose_data["joint_angles"]
 
-        # Load MuJoCo model
-        model = mj.MjModel.from_xml_path(robot_xml_path)
+        # Load MuJoCo model (cached per path)
+        model, body_names, body_ids, joint_qposadr = _load_mj_model(robot_xml_path)
         data = mj.MjData(model)
 
         # Set root position (first 3 elements of qpos for freejoint)
@@ -145,54 +223,53 @@ class SkeletonLoader:
         else:
             qpos_offset = 0
 
-        # Set joint angles
-        for joint_name, angle in joint_angles.items():
-            # Find joint ID by name
-            try:
-                joint_id = mj.mj_name2id(model, mj.mjtObj.mjOBJ_JOINT, joint_name)
-                joint_qposadr = model.jnt_qposadr[joint_id]
-                data.qpos[joint_qposadr] = angle
-            except KeyError:
+        # Set joint angles with a single scatter into qpos
+        known_joints = []
+        for joint_name in joint_angles:
+            if joint_name in joint_qposadr:
+                known_joints.append(joint_name)
+            else:
                 print(f"Warning: Joint '{joint_name}' not found in model, skipping")
 
+        qpos_indices = np.fromiter(
+            (joint_qposadr[name] for name in known_joints), dtype=np.intp, count=len(known_joints)
+        )
+        data.qpos[qpos_indices] = np.fromiter(
+            (joint_angles[name] for name in known_joints), dtype=np.float64, count=len(known_joints)
+        )
+
         # Compute forward kinematics
         mj.mj_forward(model, data)
 
-        # Extract all body positions and orientations
-        skeleton = {}
-        for body_id in range(model.nbody):
-            body = model.body(body_id)
-            position = data.xpos[body_id].tolist()
-            orientation = data.xquat[body_id].tolist()
-
-            skeleton[body.name] = {
-                "position": position,
-                "orientation": orientation
-            }
-
-        return skeleton
+        # Gather all named body positions and orientations in bulk; body names
+        # come from the model cache
+        return Skeleton(list(body_names), data.xpos[body_ids], data.xquat[body_ids])
 
     @staticmethod
-    def load(path: str, skeleton_type: str = "auto", robot_xml_path: str = None) -> Dict[str, Dict[str, List[float]]]:
+    def load(path: str, skeleton_type: str = "auto", robot_xml_path: str = None,
+             preloaded: Optional[dict] = None) -> Skeleton:
         """Load skeleton with automatic type detection.
 
         Args:
             path: Path to skeleton file
             skeleton_type: Type of skeleton ("json", "mjcf", "smplx", "robot_pose", or "auto")
             robot_xml_path: Path to robot XML file (required for robot_pose type)
+            preloaded: Already-parsed contents of a JSON skeleton or pose file,
+                used for type detection and loading instead of re-reading the file
 
         Returns:
-            Dictionary mapping body names to position and orientation
+            Skeleton with body names, positions and orientations
         """
         if skeleton_type == "auto":
             # Auto-detect based on file extension and content
             if path.endswith('.json'):
-                # Check if it's a robot pose JSON by reading the file
-                with open(path, 'r') as f:
-                    data = json.load(f)
+                # Check if it's a robot pose JSON by reading the file; the
+                # parsed data is handed to the loader below so it is read once
+                if preloaded is None:
+                    preloaded = read_json(path)
 
                 # Robot pose JSON has "joint_angles" key
-                if "joint_angles" in data:
+                if "joint_angles" in preloaded:
                     skeleton_type = "robot_pose"
                 else:
                     skeleton_type = "json"
@@ -203,15 +280,21 @@ class SkeletonLoader:
             else:
                 raise ValueError(f"Cannot auto-detect skeleton type for file: {path}")
 
-        if skeleton_type == "json":
-            return SkeletonLoader.from_json(path)
-        elif skeleton_type == "mjcf":
-            return SkeletonLoader.from_mjcf(path)
-        elif skeleton_type == "robot_pose":
-            if robot_xml_path is None:
-                raise ValueError("robot_xml_path is required for robot_pose skeleton type")
-            return SkeletonLoader.from_robot_pose(path, robot_xml_path)
-        elif skeleton_type == "smplx":
-            raise ValueError("SMPL-X loading requires body_model_path. Use from_smplx() directly.")
-        else:
+        loader = SkeletonLoader._LOADERS.get(skeleton_type)
+        if loader is None:
+            if skeleton_type == "smplx":
+                raise ValueError("SMPL-X loading requires body_model_path. Use from_smplx() directly.")
             raise ValueError(f"Unknown skeleton type: {skeleton_type}")
+        if skeleton_type == "robot_pose" and robot_xml_path is None:
+            raise ValueError("robot_xml_path is required for robot_pose skeleton type")
+
+        return loader(path, robot_xml_path, preloaded)
+
+    # Loader per skeleton type, called as loader(path, robot_xml_path, preloaded)
+    _LOADERS = {
+        "json": lambda path, robot_xml_path, preloaded: SkeletonLoader.from_json(path, preloaded),
+        "mjcf": lambda path, robot_xml_path, preloaded: SkeletonLoader.from_mjcf(path),
+        "robot_pose": lambda path, robot_xml_path, preloaded: SkeletonLoader.from_robot_pose(
+            path, robot_xml_path, preloaded
+        ),
+    }
@@ -16,19 +16,88 @@ Usage:
 
 import sys
 import os
+import contextlib
+import io
 import json
+import functools
+import multiprocessing
+import re
 import argparse
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from ik_config_editor.json_io import read_json
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, fall back to a full parse
+    ijson = None
+
+# Top-level keys every IK config must have, in report order, plus a set for
+# the common all-present check
+_REQUIRED_KEYS = (
+    "robot_root_name",
+    "human_root_name",
+    "ground_height",
+    "human_height_assumption",
+    "use_ik_match_table1",
+    "use_ik_match_table2",
+    "human_scale_table",
+    "ik_match_table1",
+    "ik_match_table2",
+)
+_REQUIRED_KEY_SET = frozenset(_REQUIRED_KEYS)
+
+# Body-name keywords marking feet, matched in one scan per name
+_FOOT_RE = re.compile("foot|toe|ankle")
+
+# Files larger than this are memory-mapped rather than read into a bytes copy
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _read_json_key(path: str, key: str):
+    """Read a single top-level value from a JSON file.
+
+    With ijson installed only that value is materialized; other top-level
+    entries are skipped while streaming. Falls back to a full parse.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            for value in ijson.items(f, key, use_float=True):
+                return value
+        raise KeyError(key)
+    return read_json(path, _MMAP_THRESHOLD)[key]
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path: str, key: str, mtime_ns: int, size: int):
+    """Cached _read_json_key; the file's mtime and size invalidate stale entries.
+
+    Failed parses raise and are therefore never cached.
+    """
+    return _read_json_key(path, key)
+
+
+def load_reference(path: str, key: str = "ik_match_table1"):
+    """Load one top-level value of a reference config, reusing earlier parses.
+
+    The returned value is shared between calls and must not be modified.
+    """
+    stat = os.stat(path)
+    return _load_cached(path, key, stat.st_mtime_ns, stat.st_size)
+
 
 class IKConfigTester:
     """Test and validate IK configuration files."""
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, fast: bool = False):
         self.config_path = config_path
+        # Flag mode: stop each test at its first error instead of reporting all
+        self.fast = fast
         self.config = None
         self.errors = []
         self.warnings = []
@@ -38,44 +107,115 @@ class IKConfigTester:
         """Load and parse the config file."""
         print(f"Loading config: {self.config_path}")
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
+            self.config = read_json(self.config_path, _MMAP_THRESHOLD)
             print("✓ Config loaded successfully\n")
             return True
         except FileNotFoundError:
             self.errors.append(f"Config file not found: {self.config_path}")
             return False
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
             self.errors.append(f"Invalid JSON: {e}")
             return False
 
+    # ik_match_table1 (target body, entry) pairs and lowercased body names,
+    # collected on first use (after the structure gate) and shared by the tests
+    @functools.cached_property
+    def _table1_items(self) -> List[Tuple[str, list]]:
+        return list(self.config["ik_match_table1"].items())
+
+    @functools.cached_property
+    def _table1_lower_keys(self) -> List[str]:
+        return [target_body.lower() for target_body in self.config["ik_match_table1"]]
+
+    def run(self, reference_path: Optional[str] = None) -> bool:
+        """Load the config, run the tests and print the report.
+
+        In fast mode the validity tests run quietly and stop at the first
+        error; only a config that fails them is re-tested in full and gets
+        the complete report.
+
+        Args:
+            reference_path: Optional path to a reference config for comparison
+
+        Returns:
+            True if the config has no errors
+        """
+        if not self.load_config():
+            self.print_summary()
+            return False
+
+        if self.fast:
+            # Stop at the first error and skip the (warning-only) weight analysis
+            with contextlib.redirect_stdout(io.StringIO()):
+                valid = (self.test_structure() and self.test_entry_format()
+                         and self.test_quaternions() and self.test_scales())
+
+            if valid:
+                print("✅ CONFIG IS VALID AND READY TO USE!")
+                print()
+            else:
+                # Re-run the tests to report every problem
+                self.fast = False
+                self.errors, self.warnings, self.info = [], [], []
+
+        # A config that passed the fast check has already cleared the gate
+        gate_passed = True
+        if not self.fast:
+            gate_passed = self.run_all()
+
+        if reference_path and gate_passed:
+            self.compare_with_reference(reference_path)
+
+        if not self.fast:
+            self.print_summary()
+
+        return not self.errors
+
+    def run_all(self) -> bool:
+        """Run the tests in two phases, cheapest first.
+
+        The structure and entry-format checks are a gate: the weight,
+        quaternion and scale tests index into table entries, so on a config
+        that fails the gate they would only crash or repeat the same problem.
+
+        Returns:
+            True if the gate passed and the remaining tests ran
+        """
+        if not (self.test_structure() and self.test_entry_format()):
+            return False
+        self.test_weights()
+        self.test_quaternions()
+        self.test_scales()
+        return True
+
     def test_structure(self) -> bool:
         """Test 1: Verify config has all required fields."""
         print("=" * 70)
         print("TEST 1: Structure Validation")
         print("=" * 70)
 
-        required_keys = [
-            "robot_root_name",
-            "human_root_name",
-            "ground_height",
-            "human_height_assumption",
-            "use_ik_match_table1",
-            "use_ik_match_table2",
-            "human_scale_table",
-            "ik_match_table1",
-            "ik_match_table2"
-        ]
+        if not isinstance(self.config, dict):
+            self.errors.append("Config is not a JSON object")
+            print("✗ FAILED: Config is not a JSON object\n")
+            return False
 
         missing = []
-        for key in required_keys:
-            if key not in self.config:
-                missing.append(key)
+        if not _REQUIRED_KEY_SET.issubset(self.config):
+            missing = [key for key in _REQUIRED_KEYS if key not in self.config]
 
         if missing:
             self.errors.append(f"Missing required keys: {missing}")
             print(f"✗ FAILED: Missing keys: {missing}\n")
             return False
+
+        not_objects = [
+            key for key in ("human_scale_table", "ik_match_table1", "ik_match_table2")
+            if not isinstance(self.config[key], dict)
+        ]
+        if not_objects:
+            self.errors.append(f"Tables are not JSON objects: {not_objects}")
+            print(f"✗ FAILED: Tables are not JSON objects: {not_objects}\n")
+            return False
         else:
             print("✓ All required keys present")
             print(f"  - Robot root: {self.config['robot_root_name']}")
@@ -131,14 +271,37 @@ class IKConfigTester:
 
             return True
 
-        all_valid = True
-        for target_body, entry in self.config["ik_match_table1"].items():
-            if not validate_entry("ik_match_table1", target_body, entry):
-                all_valid = False
+        def table_valid_fast(table: dict) -> bool:
+            """Check all entries of a table at once (False means check per entry)."""
+            entries = list(table.values())
+            if not all(isinstance(entry, list) and len(entry) == 5 for entry in entries):
+                return False
+            if not entries:
+                return True
+
+            sources, pos_weights, rot_weights, pos_offsets, rot_offsets = zip(*entries)
+            if not all(isinstance(source, str) for source in sources):
+                return False
+            if not all(isinstance(weight, (int, float)) for weight in pos_weights + rot_weights):
+                return False
+            try:
+                return (np.asarray(pos_offsets).shape == (len(entries), 3)
+                        and np.asarray(rot_offsets).shape == (len(entries), 4))
+            except ValueError:  # Ragged offsets
+                return False
 
-        for target_body, entry in self.config["ik_match_table2"].items():
-            if not validate_entry("ik_match_table2", target_body, entry):
-                all_valid = False
+        all_valid = True
+        for table_name in ("ik_match_table1", "ik_match_table2"):
+            table = self.config[table_name]
+            if table_valid_fast(table):
+                continue
+
+            # Slow path: find and report the invalid entries
+            for target_body, entry in table.items():
+                if not validate_entry(table_name, target_body, entry):
+                    all_valid = False
+                    if self.fast:
+                        return False
 
         if all_valid:
             print("✓ All entries have correct format")
@@ -155,15 +318,18 @@ class IKConfigTester:
         print("TEST 3: Weight Analysis")
         print("=" * 70)
 
-        # Check for feet with low position weights (common mistake!)
-        foot_keywords = ['foot', 'toe', 'ankle']
+        # Classify feet and pelvis in a single pass over table1
+        foot_search = _FOOT_RE.search
         feet_with_low_pos_weight = []
+        pelvis_weight = None
 
-        for target_body, entry in self.config["ik_match_table1"].items():
+        for (target_body, entry), lower_body in zip(self._table1_items, self._table1_lower_keys):
             pos_weight = entry[1]
-            if any(kw in target_body.lower() for kw in foot_keywords):
-                if pos_weight < 50:
-                    feet_with_low_pos_weight.append((target_body, pos_weight))
+            # Feet with low position weights are a common mistake
+            if foot_search(lower_body) and pos_weight < 50:
+                feet_with_low_pos_weight.append((target_body, pos_weight))
+            if pelvis_weight is None and 'pelvis' in lower_body:
+                pelvis_weight = pos_weight
 
         if feet_with_low_pos_weight:
             self.warnings.append("Feet have low position weights - may float off ground!")
@@ -174,9 +340,7 @@ class IKConfigTester:
             print("✓ Foot position weights look good")
 
         # Check for pelvis with low position weight
-        pelvis_bodies = [b for b in self.config["ik_match_table1"].keys() if 'pelvis' in b.lower()]
-        if pelvis_bodies:
-            pelvis_weight = self.config["ik_match_table1"][pelvis_bodies[0]][1]
+        if pelvis_weight is not None:
             if pelvis_weight < 50:
                 self.warnings.append(f"Pelvis position weight is low ({pelvis_weight})")
                 print(f"⚠ WARNING: Pelvis position weight = {pelvis_weight} (recommend >= 100)")
@@ -184,8 +348,11 @@ class IKConfigTester:
                 print(f"✓ Pelvis position weight = {pelvis_weight}")
 
         # Check for all zeros (not necessarily bad, but worth noting)
-        all_zero_pos = all(entry[1] == 0 for entry in self.config["ik_match_table1"].values())
-        if all_zero_pos:
+        table1_items = self._table1_items
+        pos_weights = np.fromiter(
+            (entry[1] for _, entry in table1_items), dtype=np.float64, count=len(table1_items)
+        )
+        if not pos_weights.any():
             self.warnings.append("All position weights are 0")
             print("⚠ WARNING: All position weights are 0 (rotation-only IK)")
 
@@ -198,22 +365,22 @@ class IKConfigTester:
         print("TEST 4: Quaternion Validation")
         print("=" * 70)
 
-        import numpy as np
-
-        invalid_quats = []
-        identity_count = 0
-
-        for target_body, entry in self.config["ik_match_table1"].items():
-            quat = np.array(entry[4])
-            norm = np.linalg.norm(quat)
-
-            # Check if valid quaternion (norm should be 1.0)
-            if not (0.99 < norm < 1.01):
-                invalid_quats.append((target_body, norm))
+        # All rotation offsets as one (N, 4) array
+        target_bodies = [target_body for target_body, _ in self._table1_items]
+        quats = np.asarray(
+            [entry[4] for _, entry in self._table1_items], dtype=np.float64
+        ).reshape(len(target_bodies), 4)
+        norms = np.linalg.norm(quats, axis=1)
+
+        # Check if valid quaternion (norm should be 1.0)
+        invalid = ~((norms > 0.99) & (norms < 1.01))
+        if self.fast and invalid.any():
+            self.errors.append("Invalid quaternions found")
+            return False
+        invalid_quats = [(target_bodies[i], norms[i]) for i in np.nonzero(invalid)[0]]
 
-            # Count identity quaternions
-            if np.allclose(quat, [1, 0, 0, 0], atol=1e-6):
-                identity_count += 1
+        # Count identity quaternions
+        identity_count = int(np.isclose(quats, [1, 0, 0, 0], atol=1e-6).all(axis=1).sum())
 
         if invalid_quats:
             print("✗ FAILED: Invalid quaternions found:")
@@ -224,7 +391,7 @@ class IKConfigTester:
         else:
             print("✓ All quaternions are valid (unit norm)")
 
-        total = len(self.config["ik_match_table1"])
+        total = len(target_bodies)
         print(f"  - Identity quaternions: {identity_count}/{total}")
         if identity_count == total:
             self.info.append("All rotation offsets are identity (no automatic calibration)")
@@ -239,8 +406,6 @@ class IKConfigTester:
         print("TEST 5: Scale Factor Analysis")
         print("=" * 70)
 
-        import numpy as np
-
         scales = list(self.config["human_scale_table"].values())
         if not scales:
             self.errors.append("human_scale_table is empty")
@@ -278,9 +443,9 @@ class IKConfigTester:
         print("TEST 6: Comparison with Reference Config")
         print("=" * 70)
 
+        # Only table1 of the reference is compared, so only that is loaded
         try:
-            with open(reference_path, 'r') as f:
-                ref_config = json.load(f)
+            ref_table1 = load_reference(reference_path, "ik_match_table1")
         except Exception as e:
             print(f"✗ Could not load reference: {e}\n")
             return
@@ -288,7 +453,7 @@ class IKConfigTester:
         print(f"Reference: {reference_path}\n")
 
         # Compare number of mappings
-        ref_count = len(ref_config["ik_match_table1"])
+        ref_count = len(ref_table1)
         our_count = len(self.config["ik_match_table1"])
 
         print(f"Mapping count:")
@@ -304,23 +469,28 @@ class IKConfigTester:
             print(f"  ✓ Same number of mappings")
 
         # Check which bodies are different
-        ref_bodies = set(ref_config["ik_match_table1"].keys())
+        ref_bodies = set(ref_table1.keys())
         our_bodies = set(self.config["ik_match_table1"].keys())
 
-        missing = ref_bodies - our_bodies
-        extra = our_bodies - ref_bodies
+        # Equal sets (the common case) skip the difference computations
+        if ref_bodies == our_bodies:
+            common_bodies = ref_bodies
+        else:
+            missing = ref_bodies - our_bodies
+            extra = our_bodies - ref_bodies
+
+            if missing:
+                print(f"\n  Bodies in reference but not in yours: {missing}")
+            if extra:
+                print(f"\n  Bodies in yours but not in reference: {extra}")
 
-        if missing:
-            print(f"\n  Bodies in reference but not in yours: {missing}")
-        if extra:
-            print(f"\n  Bodies in yours but not in reference: {extra}")
+            common_bodies = ref_bodies & our_bodies
 
         # Compare a sample entry
-        common_bodies = ref_bodies & our_bodies
         if common_bodies:
             sample_body = list(common_bodies)[0]
             print(f"\nSample comparison ('{sample_body}'):")
-            print(f"  Reference: {ref_config['ik_match_table1'][sample_body]}")
+            print(f"  Reference: {ref_table1[sample_body]}")
             print(f"  Your config: {self.config['ik_match_table1'][sample_body]}")
 
         print()
@@ -392,6 +562,68 @@ def test_with_motion(config_path: str, motion_path: str, robot: str):
     print()
 
 
+def _validate_one(config_path: str, fast: bool = False,
+                  reference: str = None) -> Tuple[str, List[str], List[str]]:
+    """Run the quality tests on one config without printing its report.
+
+    Worker for ``--config-dir`` batch runs; each config is parsed and checked
+    in its own process.
+
+    Args:
+        config_path: Path to IK config to test
+        fast: Only check validity; the full tests run if the config fails
+        reference: Optional path to a reference config for comparison
+
+    Returns:
+        Tuple of (config_path, errors, warnings)
+    """
+    tester = IKConfigTester(config_path, fast=fast)
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            tester.run(reference)
+        except Exception as e:
+            # Keep one malformed config from aborting the whole batch
+            tester.errors.append(f"Tests crashed: {e!r}")
+    return config_path, tester.errors, tester.warnings
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    """Validate every config in ``args.config_dir`` in a process pool.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Process exit code (0 if no config has errors)
+    """
+    config_paths = sorted(
+        os.path.join(args.config_dir, name)
+        for name in os.listdir(args.config_dir) if name.endswith(".json")
+    )
+    if not config_paths:
+        print(f"✗ No *.json configs found in {args.config_dir}")
+        return 1
+
+    worker = functools.partial(_validate_one, fast=args.fast, reference=args.reference)
+    processes = min(len(config_paths), os.cpu_count() or 1)
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(worker, config_paths)
+
+    failed = 0
+    for config_path, errors, warnings in results:
+        if errors:
+            failed += 1
+            print(f"✗ {config_path} ({len(errors)} error(s), {len(warnings)} warning(s))")
+            for error in errors:
+                print(f"    - {error}")
+        else:
+            print(f"✓ {config_path} ({len(warnings)} warning(s))")
+
+    print()
+    print(f"{len(config_paths) - failed}/{len(config_paths)} configs passed")
+    return 0 if not failed else 1
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Test and validate IK configuration files",
@@ -406,6 +638,15 @@ Examples:
       --config test_data/test_ik_config.json \\
       --reference general_motion_retargeting/ik_configs/smplx_to_g1.json
 
+  # Quick validity check (full report only if the config fails)
+  python ik_config_editor/test_ik_config_quality.py --config test_data/test_ik_config.json --fast
+
+  # Exit code only, e.g. when batch-checking many configs
+  python ik_config_editor/test_ik_config_quality.py --config test_data/test_ik_config.json --fast --quiet
+
+  # Validate every config in a directory, one process per core
+  python ik_config_editor/test_ik_config_quality.py --config-dir test_data/candidates --fast
+
   # Test with motion (shows instructions)
   python ik_config_editor/test_ik_config_quality.py \\
       --config test_data/test_ik_config.json \\
@@ -414,35 +655,50 @@ Examples:
         """
     )
 
-    parser.add_argument("--config", required=True, help="Path to IK config to test")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--config", help="Path to IK config to test")
+    source.add_argument("--config-dir",
+                        help="Directory of IK configs (*.json) to validate in parallel")
     parser.add_argument("--reference", help="Path to reference config for comparison")
     parser.add_argument("--test-motion", help="Path to motion file for retargeting test")
     parser.add_argument("--robot", help="Robot name for retargeting test")
+    parser.add_argument("--fast", action="store_true",
+                        help="Only check validity; full diagnostics are printed if the config fails")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Print nothing; only the exit code reports the result")
 
     args = parser.parse_args()
 
-    # Run tests
-    tester = IKConfigTester(args.config)
+    # Buffer the report and write it out with a single call at the end
+    report = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(report):
+            return _run_tests(args)
+    finally:
+        if not args.quiet:
+            sys.stdout.write(report.getvalue())
+            sys.stdout.flush()
 
-    if not tester.load_config():
-        tester.print_summary()
-        return 1
 
-    tester.test_structure()
-    tester.test_entry_format()
-    tester.test_weights()
-    tester.test_quaternions()
-    tester.test_scales()
+def _run_tests(args: argparse.Namespace) -> int:
+    """Run the tests selected by the command-line arguments.
+
+    Args:
+        args: Parsed command-line arguments
 
-    if args.reference:
-        tester.compare_with_reference(args.reference)
+    Returns:
+        Process exit code (0 if the config has no errors)
+    """
+    if args.config_dir:
+        return _run_batch(args)
 
-    tester.print_summary()
+    tester = IKConfigTester(args.config, fast=args.fast)
+    passed = tester.run(args.reference)
 
     if args.test_motion and args.robot:
         test_with_motion(args.config, args.test_motion, args.robot)
 
-    return 0 if not tester.errors else 1
+    return 0 if passed else 1
 
 
 if __name__ == "__main__":
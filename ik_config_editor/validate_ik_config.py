@@ -1,10 +1,34 @@
 #!/usr/bin/env python3
 """Validate IK configuration files for correctness."""
 
-import json
+import os
 import sys
 from pathlib import Path
 
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ik_config_editor.json_io import read_json
+
+# Top-level keys every IK config must have, in report order
+_REQUIRED_FIELDS = (
+    "robot_root_name", "human_root_name", "human_scale_table",
+    "ik_match_table1", "ik_match_table2"
+)
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+# Identity rotation offset; a list so it compares equal to parsed JSON arrays
+_IDENTITY_QUAT = [1.0, 0.0, 0.0, 0.0]
+
+# Hip/shoulder confusion message for each 4-bit name mask:
+# target hip, target shoulder, source hip, source shoulder (high to low bit)
+_HIP_SHOULDER_DIAG = tuple(
+    "hip mapped to shoulder!" if mask & 0b1001 == 0b1001
+    else "shoulder mapped to hip!" if mask & 0b0110 == 0b0110
+    else None
+    for mask in range(16)
+)
+
 
 def validate_ik_config(config_path: str):
     """Validate an IK configuration file.
@@ -18,20 +42,16 @@ def validate_ik_config(config_path: str):
     """
     print(f"Validating IK config: {config_path}\n")
 
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    config = read_json(config_path)
 
     errors = []
     warnings = []
 
     # Check required fields
-    required_fields = [
-        "robot_root_name", "human_root_name", "human_scale_table",
-        "ik_match_table1", "ik_match_table2"
-    ]
-    for field in required_fields:
-        if field not in config:
-            errors.append(f"Missing required field: {field}")
+    if not _REQUIRED_FIELD_SET.issubset(config):
+        for field in _REQUIRED_FIELDS:
+            if field not in config:
+                errors.append(f"Missing required field: {field}")
 
     if errors:
         print("❌ ERRORS:")
@@ -49,7 +69,7 @@ def validate_ik_config(config_path: str):
         print(f"  Table2 only: {table2_bodies - table1_bodies}")
 
     # Check for missing right_shoulder_pitch_link
-    source_bodies_in_table1 = [entry[0] for entry in config["ik_match_table1"].values()]
+    source_bodies_in_table1 = {entry[0] for entry in config["ik_match_table1"].values()}
 
     if "right_shoulder_pitch_link" not in source_bodies_in_table1:
         warnings.append("Missing correspondence for 'right_shoulder_pitch_link' in source bodies")
@@ -62,10 +82,11 @@ def validate_ik_config(config_path: str):
         source_body = entry[0]
 
         # Check for hip-shoulder confusion
-        if "hip" in target_body and "shoulder" in source_body:
-            suspicious_mappings.append(f"  ❌ {target_body} → {source_body} (hip mapped to shoulder!)")
-        elif "shoulder" in target_body and "hip" in source_body:
-            suspicious_mappings.append(f"  ❌ {target_body} → {source_body} (shoulder mapped to hip!)")
+        mask = (("hip" in target_body) << 3 | ("shoulder" in target_body) << 2
+                | ("hip" in source_body) << 1 | ("shoulder" in source_body))
+        diagnosis = _HIP_SHOULDER_DIAG[mask]
+        if diagnosis:
+            suspicious_mappings.append(f"  ❌ {target_body} → {source_body} ({diagnosis})")
         elif target_body == source_body:
             print(f"  ✓ {target_body} → {source_body} (perfect match)")
         else:
@@ -89,15 +110,9 @@ def validate_ik_config(config_path: str):
 
     # Check rotation offsets
     print(f"\n🔄 Rotation offsets:")
-    identity_count = 0
-    non_identity_count = 0
-
-    for target_body, entry in config["ik_match_table1"].items():
-        rot_offset = entry[4]
-        if rot_offset == [1.0, 0.0, 0.0, 0.0]:
-            identity_count += 1
-        else:
-            non_identity_count += 1
+    table1_entries = config["ik_match_table1"].values()
+    identity_count = sum(entry[4] == _IDENTITY_QUAT for entry in table1_entries)
+    non_identity_count = len(table1_entries) - identity_count
 
     print(f"  Identity offsets: {identity_count}")
     print(f"  Non-identity offsets: {non_identity_count}")
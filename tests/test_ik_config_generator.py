@@ -0,0 +1,47 @@
+"""Tests for IKConfigGenerator."""
+
+import unittest
+
+import numpy as np
+
+from ik_config_editor.ik_config_generator import IKConfigGenerator
+
+
+def _make_skeletons():
+    """Build source/target skeletons whose hand offset is a 90 degree turn about y."""
+    source = {
+        "pelvis": {"position": [0.0, 0.0, 1.0], "orientation": [1.0, 0.0, 0.0, 0.0]},
+        "hand": {"position": [0.5, 0.0, 1.0], "orientation": [1.0, 0.0, 0.0, 0.0]},
+    }
+    target = {
+        "pelvis": {"position": [0.0, 0.0, 1.0], "orientation": [1.0, 0.0, 0.0, 0.0]},
+        "hand": {"position": [0.5, 0.0, 1.0], "orientation": [0.5 ** 0.5, 0.0, -(0.5 ** 0.5), 0.0]},
+    }
+    correspondences = {"pelvis": "pelvis", "hand": "hand"}
+    return source, target, correspondences
+
+
+class TestCalibrationCache(unittest.TestCase):
+    def test_offsets_not_shared_between_generators(self):
+        source, target, correspondences = _make_skeletons()
+
+        first = IKConfigGenerator(source, target, correspondences, auto_calculate_offsets=True)
+        first.rotation_offsets["hand"][:] = 0
+
+        second = IKConfigGenerator(source, target, correspondences, auto_calculate_offsets=True)
+        np.testing.assert_allclose(
+            second.rotation_offsets["hand"], [0.5 ** 0.5, 0.0, -(0.5 ** 0.5), 0.0]
+        )
+
+    def test_edited_skeleton_is_recalculated(self):
+        source, target, correspondences = _make_skeletons()
+
+        first = IKConfigGenerator(source, target, correspondences, auto_calculate_scales=True)
+        source["pelvis"]["position"][2] = 2.0
+        second = IKConfigGenerator(source, target, correspondences, auto_calculate_scales=True)
+
+        self.assertNotEqual(first.height_scale, second.height_scale)
+
+
+if __name__ == "__main__":
+    unittest.main()